@@ -24,7 +24,6 @@ All public .check methods display the result but then return the unchanged DataF
 from datetime import datetime, timedelta
 from typing import Any, Callable, List, Type, Union
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from pandas.core.groupby.groupby import DataError
 
@@ -33,8 +32,10 @@ from .display import (
     _display_plot,
     _display_plot_title,
     _display_table_title,
+    _is_terminal,
 )
 from .options import (
+    _MODE,
     disable_checks,
     enable_checks,
     get_mode,
@@ -42,13 +43,35 @@ from .options import (
     set_format,
     set_mode,
 )
-from .run_checks import _apply_modifications, _check_data
+from .run_checks import _apply_modifications, _check_data, _identity
 from .timer import print_time_elapsed
-from .utils import _has_nulls, _is_type, _lambda_to_string
+from .utils import (
+    _HEAD_TITLE_PREFIX,
+    _TAIL_TITLE_PREFIX,
+    _arrow_null_counts,
+    _has_nulls,
+    _head_rows,
+    _is_type,
+    _lambda_to_string,
+    _report_assertion,
+    _resolve_write_format,
+    _series_unique,
+    _series_value_counts,
+    _tail_rows,
+    _type_fail_message,
+    _write_data,
+)
+
+# Prefixes of default check names that include a dynamic value
+_DUP_TITLE_PREFIX = "👯‍♂️ Rows with duplication in "
+_NULLS_TITLE_PREFIX = "👻 Rows with NaNs in "
 
 
 @pd.api.extensions.register_dataframe_accessor("check")
 class DataFrameChecks:
+    # An accessor is created for every new object in a method chain, so skip the per-instance dict
+    __slots__ = ("_obj",)
+
     def __init__(self, pandas_obj: Union[pd.DataFrame, pd.Series]) -> None:
         self._obj = pandas_obj
 
@@ -87,8 +110,8 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_data(
-            condition=lambda df: df.isna().all().all(),
+        self.assert_data(
+            condition=lambda df: df.isna().all(axis=None),
             fail_message=fail_message,
             pass_message=pass_message,
             subset=subset,
@@ -150,7 +173,7 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
-        if not get_mode()["enable_asserts"]:
+        if not _MODE["enable_asserts"]:
             return self._obj
         if not callable(condition):
             raise TypeError(
@@ -158,67 +181,20 @@ class DataFrameChecks:
             )
         data = self._obj[subset] if subset else self._obj
         result = condition(data)
-        condition_str = _lambda_to_string(condition)
-
-        # Fail
-        if not result:
-            if raise_exception:
-                raise exception_to_raise(
-                    f"{fail_message}{' :' + condition_str if condition_str and message_shows_condition else ''}"
-                )
-            else:
-                if message_shows_condition:
-                    _display_line(
-                        lead_in=fail_message,
-                        line=condition_str,
-                        colors={
-                            "lead_in_text_color": pd.get_option(
-                                "pdchecks.fail_message_fg_color"
-                            ),
-                            "lead_in_background_color": pd.get_option(
-                                "pdchecks.fail_message_bg_color"
-                            ),
-                        },
-                    )
-                else:
-                    _display_line(
-                        line=fail_message,
-                        colors={
-                            "text_color": pd.get_option(
-                                "pdchecks.fail_message_fg_color"
-                            ),
-                            "text_background_color": pd.get_option(
-                                "pdchecks.fail_message_bg_color"
-                            ),
-                        },
-                    )
-
-        # Pass
-        if result and verbose:
-            if message_shows_condition:
-                _display_line(
-                    lead_in=pass_message,
-                    line=condition_str,
-                    colors={
-                        "lead_in_text_color": pd.get_option(
-                            "pdchecks.pass_message_fg_color"
-                        ),
-                        "lead_in_background_color": pd.get_option(
-                            "pdchecks.pass_message_bg_color"
-                        ),
-                    },
-                )
-            else:
-                _display_line(
-                    line=pass_message,
-                    colors={
-                        "text_color": pd.get_option("pdchecks.pass_message_fg_color"),
-                        "text_background_color": pd.get_option(
-                            "pdchecks.pass_message_bg_color"
-                        ),
-                    },
-                )
-
+        # Passed silently, the common case. Skip building any messages
+        if result and not verbose:
+            return self._obj
+        _report_assertion(
+            result,
+            fail_message=fail_message,
+            pass_message=pass_message,
+            raise_exception=raise_exception,
+            exception_to_raise=exception_to_raise,
+            verbose=verbose,
+            condition_str=_lambda_to_string(condition)
+            if message_shows_condition
+            else None,
+        )
         return self._obj
 
     def assert_datetime(
@@ -254,7 +230,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_type(
+        self.assert_type(
             dtype=datetime,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -299,7 +275,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_type(
+        self.assert_type(
             dtype=float,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -353,11 +329,11 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
         if or_equal_to:
-            min_fn = lambda df: (df >= min).all().all()
+            min_fn = lambda df: (df >= min).all(axis=None)
         else:
-            min_fn = lambda df: (df > min).all().all()
+            min_fn = lambda df: (df > min).all(axis=None)
 
-        self._obj.check.assert_data(
+        self.assert_data(
             condition=min_fn,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -402,7 +378,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_type(
+        self.assert_type(
             dtype=int,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -455,11 +431,11 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
         if or_equal_to:
-            max_fn = lambda df: (df <= max).all().all()
+            max_fn = lambda df: (df <= max).all(axis=None)
         else:
-            max_fn = lambda df: (df < max).all().all()
+            max_fn = lambda df: (df < max).all(axis=None)
 
-        self._obj.check.assert_data(
+        self.assert_data(
             condition=max_fn,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -515,8 +491,8 @@ class DataFrameChecks:
                 # _has_nulls() will raise exception or print failure
                 return self._obj
 
-        self._obj.dropna().check.assert_data(
-            condition=lambda df: (df < 0).all().all(),
+        DataFrameChecks(self._obj.dropna()).assert_data(
+            condition=lambda df: (df < 0).all(axis=None),
             fail_message=fail_message,
             pass_message=pass_message,
             subset=subset,
@@ -560,8 +536,8 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_data(
-            condition=lambda df: df.isna().any().any() == False,
+        self.assert_data(
+            condition=lambda df: not df.isna().any(axis=None),
             fail_message=fail_message,
             pass_message=pass_message,
             subset=subset,
@@ -605,7 +581,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_data(
+        self.assert_data(
             condition=lambda df: df.shape[0] == nrows,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -660,8 +636,8 @@ class DataFrameChecks:
                 # _has_nulls() will raise exception or print failure
                 return self._obj
 
-        self._obj.dropna().check.assert_data(
-            condition=lambda df: (df > 0).all().all(),
+        DataFrameChecks(self._obj.dropna()).assert_data(
+            condition=lambda df: (df > 0).all(axis=None),
             fail_message=fail_message,
             pass_message=pass_message,
             subset=subset,
@@ -709,7 +685,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_data(
+        self.assert_data(
             condition=lambda df: df.shape[0] == other.shape[0],
             fail_message=fail_message,
             pass_message=pass_message,
@@ -753,7 +729,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_type(
+        self.assert_type(
             dtype=str,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -797,7 +773,7 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_type(
+        self.assert_type(
             dtype=timedelta,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -843,6 +819,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_asserts"]:
+            return self._obj
 
         if not subset:
             subset = self._obj.columns.tolist()
@@ -853,22 +831,22 @@ class DataFrameChecks:
         ):  # Single multiindex, like in brain_networks.csv test case
             subset = [subset]
 
-        found_dtypes = ", ".join([t.name for t in self._obj[subset].dtypes.values])
-        if not fail_message:
-            dtype_clean = (
-                str(dtype).replace("<class", "").replace(">", "").replace("'", "")
-            )  # <class > types will get blanked out in our HTML display
-            fail_message = (
-                f" ㄨ Assert type failed: expected {dtype_clean}, got {found_dtypes}"
-            )
-        self._obj.check.assert_data(
-            condition=lambda df: _is_type(df, dtype),
-            fail_message=fail_message,
+        data = self._obj[subset]
+        result = _is_type(data, dtype)
+        _report_assertion(
+            result,
+            # Only build the default message if it will be shown
+            fail_message=fail_message
+            or (
+                ""
+                if result
+                else _type_fail_message(
+                    dtype, ", ".join([t.name for t in data.dtypes.values])
+                )
+            ),
             pass_message=pass_message,
-            subset=subset,
             raise_exception=raise_exception,
             exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
             verbose=verbose,
         )
         return self._obj
@@ -909,8 +887,10 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_asserts"]:
+            return self._obj
 
-        self._obj.check.assert_data(
+        self.assert_data(
             condition=lambda df: df.duplicated().sum() == 0,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -924,7 +904,7 @@ class DataFrameChecks:
 
     def columns(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "🏛️ Columns",
     ) -> pd.DataFrame:
@@ -946,6 +926,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.columns.tolist(),
@@ -957,7 +939,7 @@ class DataFrameChecks:
 
     def describe(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "📏 Distributions",
         **kwargs: Any,
@@ -983,6 +965,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.describe(**kwargs),
@@ -1016,7 +1000,7 @@ class DataFrameChecks:
 
     def dtypes(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "🗂️ Data types",
     ) -> pd.DataFrame:
@@ -1038,6 +1022,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.dtypes,
@@ -1072,7 +1058,7 @@ class DataFrameChecks:
 
     def function(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
@@ -1095,6 +1081,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(self._obj, modify_fn=fn, subset=subset, check_name=check_name)
         return self._obj
 
@@ -1126,7 +1114,7 @@ class DataFrameChecks:
     def head(
         self,
         n: int = 5,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
@@ -1151,18 +1139,20 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
-            check_fn=lambda df: df.head(n),
+            check_fn=lambda df: _head_rows(df, n),
             modify_fn=fn,
             subset=subset,
-            check_name=check_name if check_name else f"⬆️ First {n} rows",
+            check_name=check_name if check_name else _HEAD_TITLE_PREFIX + f"{n} rows",
         )
         return self._obj
 
     def hist(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = [],
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -1194,7 +1184,7 @@ class DataFrameChecks:
             Only renders in interactive mode (IPython/Jupyter), not in terminal.
         """
         if (
-            get_mode()["enable_checks"] and not pd.core.config_init.is_terminal()
+            _MODE["enable_checks"] and not _is_terminal()
         ):  # Only display if in IPython/Jupyter, or we'd just print the title
             _display_plot_title(
                 check_name
@@ -1209,7 +1199,7 @@ class DataFrameChecks:
 
     def info(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "ℹ️ Info",
         **kwargs: Any,
@@ -1235,7 +1225,7 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
-        if get_mode()["enable_checks"]:
+        if _MODE["enable_checks"]:
             if check_name:
                 _display_table_title(check_name)
             (_apply_modifications(self._obj, fn, subset).info(**kwargs))
@@ -1243,7 +1233,7 @@ class DataFrameChecks:
 
     def memory_usage(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "💾 Memory usage",
         **kwargs: Any,
@@ -1272,6 +1262,8 @@ class DataFrameChecks:
         Note:
             Include argument `deep=True` to get further memory usage of object dtypes in the DataFrame. See Pandas docs for [memory_usage()](https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.memory_usage.html) for more info.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.memory_usage(**kwargs),
@@ -1283,7 +1275,7 @@ class DataFrameChecks:
 
     def ncols(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "🏛️ Columns",
     ) -> pd.DataFrame:
@@ -1305,6 +1297,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.shape[1],
@@ -1316,7 +1310,7 @@ class DataFrameChecks:
 
     def ndups(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -1343,6 +1337,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.duplicated(**kwargs).sum(),
@@ -1350,7 +1346,7 @@ class DataFrameChecks:
             subset=subset,
             check_name=check_name
             if check_name
-            else f"👯‍♂️ Rows with duplication in {subset}"
+            else _DUP_TITLE_PREFIX + str(subset)
             if subset
             else "👯‍♂️ Duplicated rows",
         )
@@ -1358,7 +1354,7 @@ class DataFrameChecks:
 
     def nnulls(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         by_column: bool = True,
         check_name: Union[str, None] = "👻 Rows with NaNs",
@@ -1391,11 +1387,18 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
-        if not get_mode()["enable_checks"]:
+        if not _MODE["enable_checks"]:
             return self._obj
         data = _apply_modifications(self._obj, fn, subset)
+        arrow_na_counts = (
+            _arrow_null_counts(data)
+            if isinstance(data, pd.DataFrame) and by_column
+            else None
+        )
         na_counts = (
-            data.isna().any(axis=1).sum()
+            arrow_na_counts
+            if arrow_na_counts is not None
+            else data.isna().any(axis=1).sum()
             if isinstance(data, pd.DataFrame) and not by_column
             else data.isna().sum()
             if not by_column
@@ -1406,13 +1409,13 @@ class DataFrameChecks:
         ):  # Report result as a pandas object
             _check_data(
                 na_counts,
-                check_name=f"👻 Rows with NaNs in {subset}"
+                check_name=_NULLS_TITLE_PREFIX + str(subset)
                 if subset and not check_name
                 else check_name,
             )
         else:  # Report on one line
             _display_line(
-                (f"👻 Rows with NaNs in {subset}: {na_counts} out of {data.shape[0]}")
+                (_NULLS_TITLE_PREFIX + f"{subset}: {na_counts} out of {len(data)}")
                 if subset and not check_name
                 else f"{check_name}: {na_counts}"
             )
@@ -1420,7 +1423,7 @@ class DataFrameChecks:
 
     def nrows(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "☰ Rows",
     ) -> pd.DataFrame:
@@ -1442,6 +1445,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.shape[0],
@@ -1454,7 +1459,7 @@ class DataFrameChecks:
     def nunique(
         self,
         column: str,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.DataFrame:
@@ -1480,12 +1485,12 @@ class DataFrameChecks:
             The original DataFrame, unchanged.
         """
 
-        if get_mode()["enable_checks"]:
+        if _MODE["enable_checks"]:
             (
                 _apply_modifications(
                     self._obj, fn=fn, subset=column
                 ).check.nunique(  # Apply fn, then filter to `column`, pass to SeriesChecks.check.nunique()
-                    fn=lambda df: df,  # Identity function
+                    fn=_identity,  # fn was already applied
                     check_name=check_name,
                     **kwargs,
                 )
@@ -1494,7 +1499,7 @@ class DataFrameChecks:
 
     def plot(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "",
         **kwargs: Any,
@@ -1527,7 +1532,7 @@ class DataFrameChecks:
         """
 
         # Only display plot if in IPython/Jupyter. Or we'd just print its title.
-        if get_mode()["enable_checks"] and not pd.core.config_init.is_terminal():
+        if _MODE["enable_checks"] and not _is_terminal():
             _display_plot_title(
                 check_name if "title" not in kwargs else kwargs["title"]
             )
@@ -1538,7 +1543,7 @@ class DataFrameChecks:
     def print(
         self,
         object: Any = None,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
         max_rows: int = 10,
@@ -1572,6 +1577,8 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             object if object else self._obj,
             check_fn=lambda data: data if object else data.head(max_rows),
@@ -1708,7 +1715,7 @@ class DataFrameChecks:
 
     def shape(
         self,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = "📐 Shape",
     ) -> pd.DataFrame:
@@ -1734,6 +1741,8 @@ class DataFrameChecks:
         Note:
             See also .check.nrows() and .check.ncols()
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda df: df.shape,
@@ -1746,7 +1755,7 @@ class DataFrameChecks:
     def tail(
         self,
         n: int = 5,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
@@ -1771,19 +1780,21 @@ class DataFrameChecks:
         Returns:
             The original DataFrame, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
-            check_fn=lambda df: df.tail(n),
+            check_fn=lambda df: _tail_rows(df, n),
             modify_fn=fn,
             subset=subset,
-            check_name=check_name if check_name else f"⬇️ Last {n} rows",
+            check_name=check_name if check_name else _TAIL_TITLE_PREFIX + f"{n} rows",
         )
         return self._obj
 
     def unique(
         self,
         column: str,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.DataFrame:
         """Displays the unique values in a column, without modifying the DataFrame itself.
@@ -1811,21 +1822,17 @@ class DataFrameChecks:
             `fn` is applied to the dataframe _before_ selecting `column`. If you want to select the column before modifying it, set `column=None` and start `fn` with a column selection, i.e. `fn=lambda df: df["my_column"].stuff()`
 
         """
-        if get_mode()["enable_checks"]:
-            (
-                _apply_modifications(
-                    self._obj, fn=fn, subset=column
-                ).check.unique(  # Apply fn, then filter to `column`  # Use SeriesChecks method
-                    fn=lambda df: df,  # Identify function
-                    check_name=check_name,
-                )
+        if _MODE["enable_checks"]:
+            _series_unique(
+                _apply_modifications(self._obj, fn=fn, subset=column),
+                check_name=check_name,
             )
         return self._obj
 
     def value_counts(
         self,
         column: str,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         max_rows: int = 10,
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -1855,16 +1862,12 @@ class DataFrameChecks:
         Note:
             `fn` is applied to the dataframe _before_ selecting `column`. If you want to select the column before modifying it, set `column=None` and start `fn` with a column selection, i.e. `fn=lambda df: df["my_column"].stuff()`
         """
-        if get_mode()["enable_checks"]:
-            (
-                _apply_modifications(
-                    self._obj, fn=fn, subset=column
-                ).check.value_counts(  # Apply fn, then filter to `column``  # Use SeriesChecks method
-                    max_rows=max_rows,
-                    fn=lambda df: df,  # Identity function
-                    check_name=check_name,
-                    **kwargs,
-                )
+        if _MODE["enable_checks"]:
+            _series_value_counts(
+                _apply_modifications(self._obj, fn=fn, subset=column),
+                max_rows=max_rows,
+                check_name=check_name,
+                **kwargs,
             )
         return self._obj
 
@@ -1872,7 +1875,7 @@ class DataFrameChecks:
         self,
         path: str,
         format: Union[str, None] = None,
-        fn: Callable = lambda df: df,
+        fn: Callable = _identity,
         subset: Union[str, List, None] = None,
         verbose: bool = False,
         **kwargs: Any,
@@ -1887,6 +1890,8 @@ class DataFrameChecks:
             - .tsv # Tab-separated data file
             - .xlsx
 
+        If `path` has no extension and no `format` is passed, the file is written as Feather, which is much faster to write and read than CSV.
+
         This functions uses the corresponding Pandas export function, such as `to_csv()` and `to_feather()`. See [Pandas docs for those corresponding export functions][Pandas docs for those export functions](https://pandas.pydata.org/docs/reference/io.html) for additional usage information, including more configuration options you can pass to this Pandas Checks method.
 
         Example:
@@ -1907,7 +1912,7 @@ class DataFrameChecks:
 
         Args:
             path: Path to write the file to.
-            format: Optional file format to force for the export. If None, format is inferred from the file's extension in `path`.
+            format: Optional file format to force for the export, such as "csv" or "parquet". If None, format is inferred from the file's extension in `path`.
             fn: An optional lambda function to apply to the DataFrame before exporting. Example: `lambda df: df.shape[0]>10`. Applied before subset.
             subset: An optional list of column names or a string name of one column to limit which columns are exported. Applied after fn.
             verbose: Whether to print a message when the file is written.
@@ -1918,32 +1923,20 @@ class DataFrameChecks:
 
         Note:
             Exporting to some formats such as Excel, Feather, and Parquet may require you to install additional packages.
+            Feather files are compressed with zstd unless you pass a different `compression`.
+            Feather and Parquet files are written by PyArrow in record batches. To tune the batch size, pass `chunksize` (Feather, default 64K rows) or `row_group_size` (Parquet).
+            To write files in a background thread and return immediately, run `pd.set_option("pdchecks.async_writes", True)`. The data is copied first, so later changes to the DataFrame don't reach the file. Background writes run in order. Run `pandas_checks.wait_for_writes()` to wait for them to finish and raise any errors; otherwise an error is raised by the next write() call or when Python exits.
         """
 
-        if not get_mode()["enable_checks"]:
+        if not _MODE["enable_checks"]:
             return self._obj
-        format_clean = format.lower().replace(".", "").strip() if format else None
-        data = _apply_modifications(self._obj, fn, subset)
-        if path.endswith(".csv") or format_clean == "csv":
-            data.to_csv(path, **kwargs)
-        elif path.endswith(".feather") or format_clean == "feather":
-            data.to_feather(path, **kwargs)
-        elif path.endswith(".parquet") or format_clean == "parquet":
-            data.to_parquet(path, **kwargs)
-        elif path.endswith(".pkl") or format_clean == "pickle":
-            data.to_pickle(path, **kwargs)
-        elif path.endswith(".tsv") or format_clean == "tsv":
-            data.to_csv(path, sep="\t", **kwargs)
-        elif (
-            path.endswith(".xls")
-            or path.endswith(".xlsx")
-            or format_clean in ["xlsx", "xls", "excel"]
-        ):
-            data.to_excel(path, **kwargs)
-        else:
-            raise AttributeError(
-                f"Can't write data to file. Unknown file extension in: {path}. "
-            )
-        if verbose:
-            _display_line(f"📦 Wrote file {path}")
+        # Fail before running fn, which may be expensive
+        format_clean = _resolve_write_format(path, format)
+        _write_data(
+            _apply_modifications(self._obj, fn, subset),
+            path,
+            format_clean,
+            verbose=verbose,
+            **kwargs,
+        )
         return self._obj
@@ -21,15 +21,23 @@ Now new methods are accessible to Pandas Series as ".check":
 All public .check methods display the result but then return the unchanged Series, so a method chain continues unbroken.
 """
 
+import operator
 from datetime import datetime, timedelta
 from typing import Any, Callable, Type, Union
 
-import matplotlib.pyplot as plt
 import pandas as pd
 from pandas.core.groupby.groupby import DataError
 
-from .display import _display_line, _display_table_title
+from .display import (
+    _display_line,
+    _display_plot,
+    _display_plot_title,
+    _display_table_title,
+    _is_terminal,
+    _new_plot_axes,
+)
 from .options import (
+    _MODE,
     disable_checks,
     enable_checks,
     get_mode,
@@ -37,16 +45,75 @@ from .options import (
     set_format,
     set_mode,
 )
-from .run_checks import _apply_modifications, _check_data
+from .run_checks import _apply_modifications, _check_data, _identity
 from .timer import print_time_elapsed
-from .utils import _has_nulls, _is_type, _lambda_to_string
+from .utils import (
+    _DTYPE_KINDS,
+    _HEAD_TITLE_PREFIX,
+    _TAIL_TITLE_PREFIX,
+    _all_satisfy,
+    _as_frame,
+    _has_nulls,
+    _head_rows,
+    _is_type,
+    _lambda_to_string,
+    _report_assertion,
+    _resolve_write_format,
+    _series_label,
+    _series_memory_usage,
+    _series_null_count,
+    _series_unique,
+    _series_value_counts,
+    _tail_rows,
+    _type_fail_message,
+    _write_data,
+)
 
 
 @pd.api.extensions.register_series_accessor("check")
 class SeriesChecks:
+    # An accessor is created for every new object in a method chain, so skip the per-instance dict
+    __slots__ = ("_obj",)
+
     def __init__(self, pandas_obj: pd.Series) -> None:
         self._obj = pandas_obj
 
+    def _assert_kind(
+        self,
+        dtype: Type[Any],
+        fail_message: Union[str, None],
+        pass_message: str,
+        raise_exception: bool,
+        exception_to_raise: Type[BaseException],
+        verbose: bool,
+    ) -> pd.Series:
+        """Tests whether Series has one of the dtype kinds of a generic type in _DTYPE_KINDS.
+        The fast path of assert_type(), also used by assert_datetime(), assert_float(), etc.
+
+        Args:
+            dtype: The expected type, a key in _DTYPE_KINDS.
+            fail_message: Message to display if the condition fails. If None, will report expected vs observed type.
+            pass_message: Message to display if the condition passes.
+            raise_exception: Whether to raise an exception if the condition fails.
+            exception_to_raise: The exception to raise if the condition fails and raise_exception is True.
+            verbose: Whether to display the pass message if the condition passes.
+
+        Returns:
+            The original Series, unchanged.
+        """
+        if _MODE["enable_asserts"]:
+            result = self._obj.dtype.kind in _DTYPE_KINDS[dtype]
+            _report_assertion(
+                result,
+                fail_message=fail_message
+                or ("" if result else _type_fail_message(dtype, self._obj.dtypes)),
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
+        return self._obj
+
     def assert_all_nulls(
         self,
         fail_message: str = " ㄨ Assert all nulls failed ",
@@ -81,15 +148,15 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_data(
-            condition=lambda s: s.isna().all().all(),
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+        if _MODE["enable_asserts"]:
+            _report_assertion(
+                self._obj.count() == 0,  # count() excludes nulls
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_data(
@@ -133,72 +200,27 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        if not get_mode()["enable_asserts"]:
+        if not _MODE["enable_asserts"]:
             return self._obj
         if not callable(condition):
             raise TypeError(
                 f"Expected condition to be a lambda function (callable type) but received type {type(condition)}"
             )
         result = condition(self._obj)
-        condition_str = _lambda_to_string(condition)
-
-        # Fail
-        if not result:
-            if raise_exception:
-                raise exception_to_raise(
-                    f"{fail_message}{' :' + condition_str if condition_str and message_shows_condition else ''}"
-                )
-            else:
-                if message_shows_condition:
-                    _display_line(
-                        lead_in=fail_message,
-                        line=condition_str,
-                        colors={
-                            "lead_in_text_color": pd.get_option(
-                                "pdchecks.fail_message_fg_color"
-                            ),
-                            "lead_in_background_color": pd.get_option(
-                                "pdchecks.fail_message_bg_color"
-                            ),
-                        },
-                    )
-                else:
-                    _display_line(
-                        line=fail_message,
-                        colors={
-                            "text_color": pd.get_option(
-                                "pdchecks.fail_message_fg_color"
-                            ),
-                            "text_background_color": pd.get_option(
-                                "pdchecks.fail_message_bg_color"
-                            ),
-                        },
-                    )
-        # Pass
-        if result and verbose:
-            if message_shows_condition:
-                _display_line(
-                    lead_in=pass_message,
-                    line=condition_str,
-                    colors={
-                        "lead_in_text_color": pd.get_option(
-                            "pdchecks.pass_message_fg_color"
-                        ),
-                        "lead_in_background_color": pd.get_option(
-                            "pdchecks.pass_message_bg_color"
-                        ),
-                    },
-                )
-            else:
-                _display_line(
-                    line=pass_message,
-                    colors={
-                        "text_color": pd.get_option("pdchecks.pass_message_fg_color"),
-                        "text_background_color": pd.get_option(
-                            "pdchecks.pass_message_bg_color"
-                        ),
-                    },
-                )
+        # Passed silently, the common case. Skip building any messages
+        if result and not verbose:
+            return self._obj
+        _report_assertion(
+            result,
+            fail_message=fail_message,
+            pass_message=pass_message,
+            raise_exception=raise_exception,
+            exception_to_raise=exception_to_raise,
+            verbose=verbose,
+            condition_str=_lambda_to_string(condition)
+            if message_shows_condition
+            else None,
+        )
         return self._obj
 
     def assert_datetime(
@@ -233,15 +255,14 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_type(
-            dtype=datetime,
+        return self._assert_kind(
+            datetime,
             fail_message=fail_message,
             pass_message=pass_message,
             raise_exception=raise_exception,
             exception_to_raise=exception_to_raise,
             verbose=verbose,
         )
-        return self._obj
 
     def assert_float(
         self,
@@ -275,15 +296,14 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_type(
-            dtype=float,
+        return self._assert_kind(
+            float,
             fail_message=fail_message,
             pass_message=pass_message,
             raise_exception=raise_exception,
             exception_to_raise=exception_to_raise,
             verbose=verbose,
         )
-        return self._obj
 
     def assert_greater_than(
         self,
@@ -321,20 +341,17 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        if or_equal_to:
-            min_fn = lambda s: (s >= min).all().all()
-        else:
-            min_fn = lambda s: (s > min).all().all()
+        comparison = operator.ge if or_equal_to else operator.gt
 
-        self._obj.check.assert_data(
-            condition=min_fn,
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+        if _MODE["enable_asserts"]:
+            _report_assertion(
+                _all_satisfy(self._obj, comparison, min, skipna=False),
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_int(
@@ -369,15 +386,14 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_type(
-            dtype=int,
+        return self._assert_kind(
+            int,
             fail_message=fail_message,
             pass_message=pass_message,
             raise_exception=raise_exception,
             exception_to_raise=exception_to_raise,
             verbose=verbose,
         )
-        return self._obj
 
     def assert_less_than(
         self,
@@ -419,20 +435,17 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        if or_equal_to:
-            max_fn = lambda s: (s <= max).all().all()
-        else:
-            max_fn = lambda s: (s < max).all().all()
+        comparison = operator.le if or_equal_to else operator.lt
 
-        self._obj.check.assert_data(
-            condition=max_fn,
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+        if _MODE["enable_asserts"]:
+            _report_assertion(
+                _all_satisfy(self._obj, comparison, max, skipna=False),
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_negative(
@@ -469,25 +482,27 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        if assert_no_nulls:
-            if _has_nulls(
-                data=self._obj,
-                fail_message=fail_message,
-                raise_exception=raise_exception,
-                exception_to_raise=exception_to_raise,
-            ):
+        if _MODE["enable_asserts"]:
+            # hasnans is cached by Pandas, so only build a null mask when there are nulls to report
+            if assert_no_nulls and self._obj.hasnans:
                 # _has_nulls() will raise exception or print failure
+                _has_nulls(
+                    data=self._obj,
+                    fail_message=fail_message,
+                    raise_exception=raise_exception,
+                    exception_to_raise=exception_to_raise,
+                )
                 return self._obj
 
-        self._obj.dropna().check.assert_data(
-            condition=lambda s: (s < 0).all().all(),
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+            _report_assertion(
+                # If we already asserted there are no nulls, don't look for nulls to skip
+                _all_satisfy(self._obj, operator.lt, 0, skipna=not assert_no_nulls),
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_no_nulls(
@@ -521,15 +536,15 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_data(
-            condition=lambda s: s.isna().any().any() == False,
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+        if _MODE["enable_asserts"]:
+            _report_assertion(
+                not self._obj.hasnans,  # Cached by Pandas
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_nrows(
@@ -566,15 +581,15 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_data(
-            condition=lambda s: s.shape[0] == nrows,
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+        if _MODE["enable_asserts"]:
+            _report_assertion(
+                len(self._obj) == nrows,
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_positive(
@@ -610,25 +625,27 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        if assert_no_nulls:
-            if _has_nulls(
-                data=self._obj,
-                fail_message=fail_message,
-                raise_exception=raise_exception,
-                exception_to_raise=exception_to_raise,
-            ):
+        if _MODE["enable_asserts"]:
+            # hasnans is cached by Pandas, so only build a null mask when there are nulls to report
+            if assert_no_nulls and self._obj.hasnans:
                 # _has_nulls() will raise exception or print failure
+                _has_nulls(
+                    data=self._obj,
+                    fail_message=fail_message,
+                    raise_exception=raise_exception,
+                    exception_to_raise=exception_to_raise,
+                )
                 return self._obj
 
-        self._obj.dropna().check.assert_data(
-            condition=lambda s: (s > 0).all().all(),
-            pass_message=pass_message,
-            fail_message=fail_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+            _report_assertion(
+                # If we already asserted there are no nulls, don't look for nulls to skip
+                _all_satisfy(self._obj, operator.gt, 0, skipna=not assert_no_nulls),
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_same_nrows(
@@ -667,15 +684,15 @@ class SeriesChecks:
             The original DataFrame, unchanged.
         """
 
-        self._obj.check.assert_data(
-            condition=lambda df: df.shape[0] == other.shape[0],
-            fail_message=fail_message,
-            pass_message=pass_message,
-            raise_exception=raise_exception,
-            exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
-            verbose=verbose,
-        )
+        if _MODE["enable_asserts"]:
+            _report_assertion(
+                len(self._obj) == len(other),
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
+            )
         return self._obj
 
     def assert_str(
@@ -710,7 +727,7 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_type(
+        self.assert_type(
             dtype=str,
             fail_message=fail_message,
             pass_message=pass_message,
@@ -751,15 +768,14 @@ class SeriesChecks:
             The original Series, unchanged.
         """
 
-        self._obj.check.assert_type(
-            dtype=timedelta,
+        return self._assert_kind(
+            timedelta,
             fail_message=fail_message,
             pass_message=pass_message,
             raise_exception=raise_exception,
             exception_to_raise=exception_to_raise,
             verbose=verbose,
         )
-        return self._obj
 
     def assert_type(
         self,
@@ -795,22 +811,28 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
+        if not _MODE["enable_asserts"]:
+            return self._obj
 
-        found_dtype = self._obj.dtypes
-        if not fail_message:
-            dtype_clean = (
-                str(dtype).replace("<class", "").replace(">", "").replace("'", "")
-            )  # <class > types will get blanked out in our HTML display
-            fail_message = (
-                f" ㄨ Assert type failed: expected {dtype_clean}, got {found_dtype}"
+        # Generic types only need a comparison of the dtype kind
+        if isinstance(dtype, (type, str)) and dtype in _DTYPE_KINDS:
+            return self._assert_kind(
+                dtype,
+                fail_message=fail_message,
+                pass_message=pass_message,
+                raise_exception=raise_exception,
+                exception_to_raise=exception_to_raise,
+                verbose=verbose,
             )
-        self._obj.check.assert_data(
-            condition=lambda s: _is_type(s, dtype),
-            fail_message=fail_message,
+        result = _is_type(self._obj, dtype)
+        _report_assertion(
+            result,
+            # Only build the default message if it will be shown
+            fail_message=fail_message
+            or ("" if result else _type_fail_message(dtype, self._obj.dtypes)),
             pass_message=pass_message,
             raise_exception=raise_exception,
             exception_to_raise=exception_to_raise,
-            message_shows_condition=False,
             verbose=verbose,
         )
         return self._obj
@@ -846,9 +868,11 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
+        if not _MODE["enable_asserts"]:
+            return self._obj
 
-        self._obj.check.assert_data(
-            condition=lambda s: s.duplicated().sum() == 0,
+        self.assert_data(
+            condition=lambda s: s.is_unique,  # Cached by Pandas
             fail_message=fail_message,
             pass_message=pass_message,
             raise_exception=raise_exception,
@@ -860,7 +884,7 @@ class SeriesChecks:
 
     def describe(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "📏 Distribution",
         **kwargs: Any,
     ) -> pd.Series:
@@ -885,8 +909,13 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.describe(
-            check_name=check_name, **kwargs
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(
+            self._obj,
+            check_fn=lambda s: _as_frame(s.describe(**kwargs)),
+            modify_fn=fn,
+            check_name=check_name,
         )
         return self._obj
 
@@ -915,7 +944,7 @@ class SeriesChecks:
 
     def dtype(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "🗂️ Data type",
     ) -> pd.Series:
         """Displays the data type of a Series, without modifying the Series itself.
@@ -936,6 +965,8 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda s: s.dtype,
@@ -969,7 +1000,7 @@ class SeriesChecks:
 
     def function(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Applies an arbitrary function on a Series and shows the result, without modifying the Series itself.
@@ -990,6 +1021,8 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(self._obj, modify_fn=fn, check_name=check_name)
         return self._obj
 
@@ -1015,13 +1048,13 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(self._obj).check.get_mode(check_name=check_name)
+        _display_line(lead_in=check_name, line=str(get_mode()))
         return self._obj
 
     def head(
         self,
         n: int = 5,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Displays the first n rows of a Series, without modifying the Series itself.
@@ -1045,14 +1078,19 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.head(
-            n=n, check_name=check_name
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(
+            self._obj,
+            check_fn=lambda s: _as_frame(_head_rows(s, n)),
+            modify_fn=fn,
+            check_name=check_name if check_name else _HEAD_TITLE_PREFIX + f"{n} rows",
         )
         return self._obj
 
     def hist(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.Series:
@@ -1080,14 +1118,18 @@ class SeriesChecks:
         Note:
             Plots are only displayed when code is run in IPython/Jupyter, not in terminal.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.hist(
-            check_name=check_name, subset=[], **kwargs
-        )
+        if (
+            _MODE["enable_checks"] and not _is_terminal()
+        ):  # Only display if in IPython/Jupyter, or we'd just print the title
+            _display_plot_title(check_name if check_name else "📏 Distributions")
+            ax = _new_plot_axes()
+            _apply_modifications(self._obj, fn).hist(ax=ax, **kwargs)
+            _display_plot(ax.figure)
         return self._obj
 
     def info(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "ℹ️ Series info",
         **kwargs: Any,
     ) -> pd.Series:
@@ -1112,7 +1154,7 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        if get_mode()["enable_checks"]:
+        if _MODE["enable_checks"]:
             if check_name:
                 _display_table_title(check_name)
             _apply_modifications(self._obj, fn).info(**kwargs)
@@ -1120,7 +1162,7 @@ class SeriesChecks:
 
     def memory_usage(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "💾 Memory usage",
         **kwargs: Any,
     ) -> pd.Series:
@@ -1148,14 +1190,19 @@ class SeriesChecks:
         Note:
             Include argument `deep=True` to get further memory usage of object dtypes. See Pandas docs for memory_usage() for more info.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.memory_usage(
-            check_name=check_name, **kwargs
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(
+            self._obj,
+            check_fn=lambda s: _series_memory_usage(s, **kwargs),
+            modify_fn=fn,
+            check_name=check_name,
         )
         return self._obj
 
     def ndups(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.Series:
@@ -1180,14 +1227,23 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.ndups(
-            fn, check_name=check_name, **kwargs
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(
+            self._obj,
+            # With keep="first" or "last", every value after its first occurrence is a duplicate,
+            # so count them from the hash table of unique values without building a boolean mask
+            check_fn=lambda s: len(s) - s.nunique(dropna=False)
+            if kwargs.get("keep", "first") in ("first", "last")
+            else s.duplicated(**kwargs).sum(),
+            modify_fn=fn,
+            check_name=check_name if check_name else "👯‍♂️ Duplicated rows",
         )
         return self._obj
 
     def nnulls(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "👻 Rows with NaNs",
     ) -> pd.Series:
         """Displays the number of rows with null values in the Series, without modifying the Series itself.
@@ -1210,14 +1266,17 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.nnulls(
-            by_column=False, check_name=check_name
+        if not _MODE["enable_checks"]:
+            return self._obj
+        # Report on one line
+        _display_line(
+            f"{check_name}: {_series_null_count(_apply_modifications(self._obj, fn))}"
         )
         return self._obj
 
     def nrows(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "☰ Rows",
     ) -> pd.Series:
         """Displays the number of rows in a Series, without modifying the Series itself.
@@ -1238,14 +1297,14 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.nrows(
-            check_name=check_name
-        )
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(self._obj, check_fn=len, modify_fn=fn, check_name=check_name)
         return self._obj
 
     def nunique(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         **kwargs: Any,
     ) -> pd.Series:
@@ -1270,19 +1329,21 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
         _check_data(
             self._obj,
             check_fn=lambda s: s.nunique(**kwargs),
             modify_fn=fn,
             check_name=check_name
             if check_name
-            else f"🌟 Unique values in {self._obj.name if self._obj.name else 'series'}",
+            else _series_label("🌟 Unique values in ", self._obj.name),
         )
         return self._obj
 
     def plot(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "",
         **kwargs: Any,
     ) -> pd.Series:
@@ -1313,15 +1374,20 @@ class SeriesChecks:
 
             If you pass a 'title' kwarg, it becomes the plot title, overriding check_name
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.plot(
-            fn, check_name=check_name, **kwargs
-        )
+        # Only display plot if in IPython/Jupyter. Or we'd just print its title.
+        if _MODE["enable_checks"] and not _is_terminal():
+            title = check_name if "title" not in kwargs else kwargs["title"]
+            if title:
+                _display_plot_title(title)
+            ax = _new_plot_axes()
+            _apply_modifications(self._obj, fn).plot(ax=ax, **kwargs)
+            _display_plot(ax.figure)
         return self._obj
 
     def print(
         self,
         object: Any = None,  # Anything printable: str, int, list, DataFrame, etc
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
         max_rows: int = 10,
     ) -> pd.Series:
@@ -1351,8 +1417,13 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.print(
-            object=object, check_name=check_name, max_rows=max_rows
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(
+            object if object else self._obj,
+            check_fn=lambda data: data if object else _as_frame(data.head(max_rows)),
+            modify_fn=_identity if object else fn,  # fn only modifies the Series
+            check_name=check_name,
         )
         return self._obj
 
@@ -1485,7 +1556,7 @@ class SeriesChecks:
 
     def shape(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = "📐 Shape",
     ) -> pd.Series:
         """Displays the Series's dimensions, without modifying the Series itself.
@@ -1510,6 +1581,8 @@ class SeriesChecks:
         Note:
             See also .check.nrows()
         """
+        if not _MODE["enable_checks"]:
+            return self._obj
 
         _check_data(
             self._obj,
@@ -1522,7 +1595,7 @@ class SeriesChecks:
     def tail(
         self,
         n: int = 5,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Displays the last n rows of the Series, without modifying the Series itself.
@@ -1545,14 +1618,19 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        pd.DataFrame(_apply_modifications(self._obj, fn)).check.tail(
-            n=n, check_name=check_name
+        if not _MODE["enable_checks"]:
+            return self._obj
+        _check_data(
+            self._obj,
+            check_fn=lambda s: _as_frame(_tail_rows(s, n)),
+            modify_fn=fn,
+            check_name=check_name if check_name else _TAIL_TITLE_PREFIX + f"{n} rows",
         )
         return self._obj
 
     def unique(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         check_name: Union[str, None] = None,
     ) -> pd.Series:
         """Displays the unique values in a Series, without modifying the Series itself.
@@ -1576,19 +1654,17 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        _check_data(
-            self._obj,
-            check_fn=lambda s: s.unique().tolist(),
-            modify_fn=fn,
-            check_name=check_name
-            if check_name
-            else f"🌟 Unique values of {self._obj.name if self._obj.name else 'series'}",
-        )
+        if _MODE["enable_checks"]:
+            _series_unique(
+                _apply_modifications(self._obj, fn),
+                check_name=check_name,
+                series_name=self._obj.name,
+            )
         return self._obj
 
     def value_counts(
         self,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         max_rows: int = 10,
         check_name: Union[str, None] = None,
         **kwargs: Any,
@@ -1615,23 +1691,20 @@ class SeriesChecks:
         Returns:
             The original Series, unchanged.
         """
-        _check_data(
-            self._obj,
-            check_fn=lambda s: s.value_counts(**kwargs).head(max_rows),
-            modify_fn=fn,
-            check_name=check_name
-            if check_name
-            else f"🧮 Value counts, first {max_rows} values"
-            if max_rows
-            else f"🧮 Value counts",
-        )
+        if _MODE["enable_checks"]:
+            _series_value_counts(
+                _apply_modifications(self._obj, fn),
+                max_rows=max_rows,
+                check_name=check_name,
+                **kwargs,
+            )
         return self._obj
 
     def write(
         self,
         path: str,
         format: Union[str, None] = None,
-        fn: Callable = lambda s: s,
+        fn: Callable = _identity,
         verbose: bool = False,
         **kwargs: Any,
     ) -> pd.Series:
@@ -1649,6 +1722,7 @@ class SeriesChecks:
 
         Note:
             Exporting to some formats such as Excel, Feather, and Parquet may require you to install additional packages.
+            Feather files are compressed with zstd unless you pass a different `compression`. See the Note in DataFrame `.check.write()` for batch sizes and background writes.
 
         Example:
             ```python
@@ -1678,9 +1752,17 @@ class SeriesChecks:
             The original Series, unchanged.
 
         """
-        (
-            pd.DataFrame(_apply_modifications(self._obj, fn)).check.write(
-                path=path, format=format, verbose=verbose, **kwargs
-            )
+        if not _MODE["enable_checks"]:
+            return self._obj
+        # Fail before running fn, which may be expensive
+        format_clean = _resolve_write_format(path, format)
+        data = _apply_modifications(self._obj, fn)
+        _write_data(
+            # fn may already return a DataFrame. Otherwise, export as a one-column table
+            _as_frame(data),
+            path,
+            format_clean,
+            verbose=verbose,
+            **kwargs,
         )
         return self._obj
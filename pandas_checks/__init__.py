@@ -15,6 +15,7 @@ __all__ = [
     "set_format",
     "set_mode",
     "start_timer",
+    "wait_for_writes",
 ]
 
 # Register our changes to the Pandas classes
@@ -32,5 +33,6 @@ from .options import (
 )
 from .SeriesChecks import SeriesChecks
 from .timer import print_time_elapsed, start_timer
+from .utils import wait_for_writes
 
 _initialize_options()
@@ -3,32 +3,63 @@
 
 import base64
 import io
+import re
 import textwrap
+from functools import lru_cache
 from typing import Any, Dict, Union
 
 import emoji
-import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from IPython.display import HTML, Markdown, display
+from IPython.display import HTML, Image, Markdown, display
 from termcolor import colored
 
+from .options import _FORMAT
+
+# Matches an empty or whitespace-only line after the first line
+_BLANK_LINE = re.compile(r"\n[^\S\n]*(?:\n|\Z)")
+
 # -----------------------
 # Utilities
 # -----------------------
 
 
-def _filter_emojis(text: str) -> str:
+@lru_cache(maxsize=None)
+def _is_terminal() -> bool:
+    """Checks whether code is running in a terminal rather than in IPython/Jupyter. Cached, since the environment doesn't change while Python runs.
+
+    Returns:
+        True if running in a terminal, False if running in IPython/Jupyter.
+    """
+    return pd.core.config_init.is_terminal()
+
+
+def _filter_emojis(text: Any) -> Any:
     """Removes emojis from text if user has globally forbidden them.
 
     Args:
-        text: The text to filter emojis from.
+        text: The text to filter emojis from. Other objects, such as the number in a check's result, are converted to text.
 
     Returns:
         The text with emojis removed if the user's global settings do not allow emojis. Else, the original text.
     """
-    if pd.get_option("pdchecks.use_emojis"):
+    if _FORMAT["use_emojis"]:
         return text
+    return _strip_emojis(str(text))
+
+
+@lru_cache(maxsize=256)
+def _strip_emojis(text: str) -> str:
+    """Removes emojis from text. Cached, since the same check names and messages are displayed repeatedly.
+
+    Args:
+        text: The text to remove emojis from.
+
+    Returns:
+        The text without emojis, stripped of surrounding whitespace.
+    """
+    if text.isascii():  # No emojis to find
+        return text.strip()
     return emoji.replace_emoji(text, replace="").strip()
 
 
@@ -41,7 +72,7 @@ def _render_html_with_indent(object_as_html: str) -> None:
     Returns:
         None
     """
-    indent = pd.get_option("pdchecks.indent_table_plot_ipython")  # In pixels
+    indent = _FORMAT["indent_table_plot_ipython"]  # In pixels
     display(
         HTML(
             f'<div style="margin-left: {indent}px;">{object_as_html}</div>'
@@ -75,47 +106,88 @@ def _render_text(
         None
     """
     if text:
-        # Format background_color for term_colors
-        text_color = colors.get("text_color", None)
-        text_background_color = colors.get("text_background_color", None)
-        lead_in_text_color = colors.get("lead_in_text_color", None)
-        lead_in_background_color = colors.get("lead_in_background_color", None)
-
-        # Remove termcolor background style format ("on_green") if user passed it that way.
-        # This syntax will be added back if we display in terminal,
-        # but must be removed if we're displaying HTML in Jupyter or IPython
-        text_background_color = (
-            text_background_color.replace("on_", "")
-            if text_background_color
-            else text_background_color
+        if _is_terminal():
+            _render_text_terminal(text, lead_in, colors)
+        else:
+            _render_text_ipython(text, tag, lead_in, colors)
+
+
+def _html_background_color(color: Union[str, None]) -> Union[str, None]:
+    """Removes termcolor's background style format ("on_green") from a color, if user passed it that way.
+
+    Args:
+        color: The background color. See syntax in docstring for _render_text().
+
+    Returns:
+        The color without "on_".
+    """
+    return color.replace("on_", "") if color else color
+
+
+def _render_text_terminal(
+    text: str, lead_in: Union[str, None] = None, colors: Dict = {}
+) -> None:
+    """Prints text with optional formatting in a terminal.
+
+    Args:
+        text: The text to print.
+        lead_in: Optional text to print before the main text.
+        colors: Optional colors for the text and lead-in text. See details in docstring for _render_text().
+
+    Returns:
+        None
+    """
+    text_color = colors.get("text_color", None)
+    # termcolor expects background colors formatted as "on_green"
+    text_background_color = _format_background_color(
+        colors.get("text_background_color", None)
+    )
+    print()  # White space for terminal display
+    # Most lines have no lead-in, so only look up its colors when there is one
+    lead_in_rendered = (
+        f"{colored(_filter_emojis(lead_in), text_color, _format_background_color(colors.get('lead_in_background_color', None)))}: "
+        if lead_in
+        else ""
+    )
+    print(
+        f"{lead_in_rendered}{colored(_filter_emojis(text), text_color, text_background_color)}"
+    )
+
+
+def _render_text_ipython(
+    text: str, tag: str, lead_in: Union[str, None] = None, colors: Dict = {}
+) -> None:
+    """Renders text with optional formatting as HTML in an IPython/Jupyter environment.
+
+    Args:
+        text: The text to render.
+        tag: The HTML tag to use for rendering.
+        lead_in: Optional text to display before the main text.
+        colors: Optional colors for the text and lead-in text. See details in docstring for _render_text().
+
+    Returns:
+        None
+    """
+    # HTML expects background colors without termcolor's "on_" format
+    text_color = colors.get("text_color", None)
+    text_background_color = _html_background_color(
+        colors.get("text_background_color", None)
+    )
+    # Most lines have no lead-in, so only look up its colors when there is one
+    lead_in_rendered = (
+        _lead_in(
+            lead_in,
+            colors.get("lead_in_text_color", None),
+            _html_background_color(colors.get("lead_in_background_color", None)),
         )
-        lead_in_background_color = (
-            lead_in_background_color.replace("on_", "")
-            if lead_in_background_color
-            else lead_in_background_color
+        if lead_in
+        else ""
+    )
+    display(
+        Markdown(
+            f"<{tag} style='text-align: left'>{lead_in_rendered}{' ' if lead_in_rendered else ''}<span style='color:{text_color}; background-color:{text_background_color}'>{_filter_emojis(text)}</span></{tag}>"
         )
-
-        # If we're not in IPython, display as text
-        if pd.core.config_init.is_terminal():
-            print()  # White space for terminal display
-            lead_in_rendered = (
-                f"{colored(_filter_emojis(lead_in), text_color, _format_background_color(lead_in_background_color))}: "
-                if lead_in
-                else ""
-            )
-            print(
-                lead_in_rendered
-                + f"{colored(_filter_emojis(text), text_color, _format_background_color(text_background_color))}"
-            )
-        else:  # Print stylish!
-            lead_in_rendered = _lead_in(
-                lead_in, lead_in_text_color, lead_in_background_color
-            )
-            display(
-                Markdown(
-                    f"<{tag} style='text-align: left'>{lead_in_rendered + ' ' if lead_in_rendered else ''}<span style='color:{text_color}; background-color:{text_background_color}'>{_filter_emojis(text)}</span></{tag}>"
-                )
-            )
+    )
 
 
 def _warning(
@@ -158,12 +230,18 @@ def _print_table_terminal(table: Union[pd.DataFrame, pd.Series]) -> None:
     Returns:
         None
     """
-    indent_prefix = pd.get_option("pdchecks.indent_table_terminal")  # In spaces
-    print(
-        textwrap.indent(
-            text=table.to_string(), prefix=" " * indent_prefix if indent_prefix else ""
+    indent_prefix = _FORMAT["indent_table_terminal"]  # In spaces
+    text = table.to_string()
+    if indent_prefix:
+        prefix = " " * indent_prefix
+        text = (
+            # Indent every line in one pass. textwrap.indent() is only needed
+            # to leave whitespace-only lines, like a header of blank column names, as they are
+            prefix + text.replace("\n", "\n" + prefix)
+            if text.partition("\n")[0].strip() and not _BLANK_LINE.search(text)
+            else textwrap.indent(text=text, prefix=prefix)
         )
-    )
+    print(text)
 
 
 def _display_table(table: Union[pd.DataFrame, pd.Series]) -> None:
@@ -177,11 +255,11 @@ def _display_table(table: Union[pd.DataFrame, pd.Series]) -> None:
     """
     _render_html_with_indent(
         table.style.set_table_styles(
-            [pd.get_option("pdchecks.table_row_hover_style")]
-            if pd.get_option("pdchecks.table_row_hover_style")
+            [_FORMAT["table_row_hover_style"]]
+            if _FORMAT["table_row_hover_style"]
             else []
         )
-        .format(precision=pd.get_option("pdchecks.precision"))
+        .format(precision=_FORMAT["precision"])
         .to_html()
     )
 
@@ -199,9 +277,7 @@ def _display_table_title(
     Returns:
         None
     """
-    _render_text(
-        line, tag=pd.get_option("table_title_tag"), lead_in=lead_in, colors=colors
-    )
+    _render_text(line, tag=_FORMAT["table_title_tag"], lead_in=lead_in, colors=colors)
 
 
 # -----------------------
@@ -209,26 +285,50 @@ def _display_table_title(
 # -----------------------
 
 
-def _display_plot() -> None:
+def _new_plot_axes() -> Any:
+    """Creates a new matplotlib figure for a check's plot, so the plot doesn't draw on the user's current figure.
+
+    Returns:
+        The axes of the new figure.
+    """
+    # Import here, since matplotlib is slow to import and only needed for plots
+    import matplotlib.pyplot as plt
+
+    return plt.subplots()[1]
+
+
+def _display_plot(fig: Any = None) -> None:
     """Renders the active Pandas Checks matplotlib plot object in an IPython/Jupyter environment with an optional indent.
 
+    Args:
+        fig: The matplotlib figure to render and then close. If None, uses the current figure.
+
     Returns:
         None
 
     Note:
         It assumes the plot has already been drawn by another function, such as with .plot() or .hist().
     """
-    if not pd.core.config_init.is_terminal():
-        indent = pd.get_option("pdchecks.indent_table_plot_ipython")  # In pixels
+    if not _is_terminal():
+        # Import here, since matplotlib is slow to import and only needed for plots
+        import matplotlib.pyplot as plt
+
+        indent = _FORMAT["indent_table_plot_ipython"]  # In pixels
         # Save the figure to a bytes buffer
         buffer = io.BytesIO()
-        fig = (
-            plt.gcf()
-        )  # TODO: Get the figure from passing the `fig` argument to _display_plot() but without generating a UserWarning from matplotlib.
+        if fig is None:
+            fig = (
+                plt.gcf()
+            )  # TODO: Get the figure from passing the `fig` argument to _display_plot() but without generating a UserWarning from matplotlib.
         fig.savefig(buffer, format="png")
         plt.close(fig)  # Don't show it at the bottom of the cell too
-        buffer.seek(0)
-        #  Encode the image to base64 string, then display it as HTML
+        if not indent:
+            # IPython can show the PNG as is, without embedding it in HTML
+            display(Image(data=buffer.getvalue(), format="png"))
+            return
+        #  Encode the image to base64 string, reading the buffer in place rather than copying it out
+        image = base64.b64encode(buffer.getbuffer()).decode("ascii")
+        # Then display it as HTML
         display(
             HTML(
                 f"""
@@ -240,12 +340,7 @@ def _display_plot() -> None:
                 </style>
 
                 <div class="indent-plot">
-                    <img src="data:image/png;base64,{
-
-                        base64
-                        .b64encode(buffer.read())
-                        .decode('utf-8')
-                        }" />
+                    <img src="data:image/png;base64,{image}" />
                 </div>
                 """
             )
@@ -265,9 +360,7 @@ def _display_plot_title(
     Returns:
         None
     """
-    _render_text(
-        line, tag=pd.get_option("plot_title_tag"), lead_in=lead_in, colors=colors
-    )
+    _render_text(line, tag=_FORMAT["plot_title_tag"], lead_in=lead_in, colors=colors)
 
 
 # -----------------------
@@ -275,8 +368,9 @@ def _display_plot_title(
 # -----------------------
 
 
+@lru_cache(maxsize=64)
 def _format_background_color(color: str) -> str:
-    """Applies a background color to text used being displayed in the terminal.
+    """Applies a background color to text used being displayed in the terminal. Cached, since checks reuse a handful of colors.
 
     Args:
         color: The background color to format. See syntax in docstring for _render_text().
@@ -301,12 +395,30 @@ def _lead_in(lead_in: Union[str, None], foreground: str, background: str) -> str
         The formatted lead-in text.
     """
     return (
-        f"<span style='color:{foreground}; background-color:{background}'>{_filter_emojis(lead_in).strip()}</span>:"
+        _lead_in_html(_filter_emojis(lead_in), foreground, background)
         if lead_in
         else ""
     )
 
 
+@lru_cache(maxsize=256)
+def _lead_in_html(lead_in: str, foreground: str, background: str) -> str:
+    """Formats lead-in text, with emojis already filtered, as HTML. Cached, since checks reuse the same lead-ins.
+
+    Args:
+        lead_in: The lead-in text to format.
+        foreground: The foreground color for the lead-in text.
+        background: The background color for the lead-in text.
+
+    Returns:
+        The formatted lead-in text.
+
+    Note:
+        Emojis are filtered before calling, so that the cache doesn't depend on the use_emojis option.
+    """
+    return f"<span style='color:{foreground}; background-color:{background}'>{lead_in.strip()}</span>:"
+
+
 def _display_line(
     line: str, lead_in: Union[str, None] = None, colors: Dict = {}
 ) -> None:
@@ -322,7 +434,7 @@ def _display_line(
     """
     _render_text(
         line,
-        tag=pd.get_option("pdchecks.check_text_tag"),
+        tag=_FORMAT["check_text_tag"],
         lead_in=lead_in,
         colors=colors,
     )
@@ -344,7 +456,7 @@ def _display_check(data: Any, name: Union[str, None] = None) -> None:
         None
     """
     # Are we in IPython/Jupyter?
-    if not pd.core.config_init.is_terminal():
+    if not _is_terminal():
         # Is it a DF?
         if isinstance(data, pd.DataFrame):
             if name:
@@ -355,12 +467,11 @@ def _display_check(data: Any, name: Union[str, None] = None) -> None:
             if name:
                 _display_table_title(name)
             _display_table(
-                pd.DataFrame(
-                    # For Series based on some Pandas outputs like memory_usage(),
-                    # don't show a column name of 0
-                    data.rename(
-                        data.name if data.name != 0 and data.name != None else ""
-                    )
+                # to_frame() doesn't copy the data, as renaming and wrapping in a DataFrame would.
+                # For Series based on some Pandas outputs like memory_usage(),
+                # don't show a column name of 0
+                data.to_frame(
+                    name=data.name if data.name != 0 and data.name != None else ""
                 )
             )
         # Display the result on one line
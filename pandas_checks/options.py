@@ -9,6 +9,18 @@ from typing import Any, Callable, Dict, List, Union
 import pandas as pd
 import pandas._config.config as cf
 
+# Current mode, mirrored from the pdchecks.enable_checks and pdchecks.enable_asserts
+# options so that each check can test it without a call to pd.get_option()
+_MODE: Dict[str, bool] = {"enable_checks": True, "enable_asserts": True}
+
+# Current value of the pdchecks.async_writes option, mirrored so that each write
+# can test it without a call to pd.get_option()
+_WRITE: Dict[str, bool] = {"async_writes": False}
+
+# Current values of format options, mirrored from their pdchecks options so that
+# displaying a check doesn't call pd.get_option(). Filled in when each option is registered
+_FORMAT: Dict[str, Any] = {}
+
 
 # -----------------------
 # Helpers
@@ -38,7 +50,11 @@ def _set_option(option: str, value: Any) -> None:
 
 
 def _register_option(
-    name: str, default_value: Any, description: str, validator: Callable
+    name: str,
+    default_value: Any,
+    description: str,
+    validator: Callable,
+    cb: Union[Callable, None] = None,
 ) -> None:
     """Registers a Pandas Checks option in the global Pandas context manager.
 
@@ -53,6 +69,7 @@ def _register_option(
         default_value: The default value for the option.
         description: A description of the option.
         validator: A function to validate the option value.
+        cb: Optional function to call with the option's full name whenever the option's value is set.
 
     Returns:
         None
@@ -73,7 +90,9 @@ def _register_option(
     except pd.errors.OptionError:
         with cf.config_prefix("pdchecks"):
             # Register it!
-            cf.register_option(key_name, default_value, description, validator)
+            cf.register_option(key_name, default_value, description, validator, cb=cb)
+        if cb:
+            cb(f"pdchecks.{key_name}")
 
 
 # -----------------------
@@ -107,6 +126,18 @@ def reset_format() -> None:
     _initialize_format_options()
 
 
+def _sync_format(option: str) -> None:
+    """Copies the value of a format option into the _FORMAT cache. Called by Pandas whenever the option is set.
+
+    Args:
+        option: The full name of the option, such as "pdchecks.fail_message_fg_color".
+
+    Returns:
+        None
+    """
+    _FORMAT[option.replace("pdchecks.", "")] = pd.get_option(option)
+
+
 def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     """Initializes or resets Pandas Checks formatting options.
 
@@ -132,6 +163,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     The floating point output precision of Pandas Checks outputs in IPython/Jupyter, in terms of number of places after the decimal, for regular formatting as well as scientific notation. Similar to ``precision`` in :meth:`numpy.set_printoptions`. Does not change precision in Pandas Checks output in terminal. Does not change precision of other Pandas operations, only Pandas Checks: to change Pandas precision, use pd.set_option('display.precision',...).
     """,
             validator=cf.is_nonnegative_int,
+            cb=_sync_format,
         )
     if "table_row_hover_style" in option_keys or options == None:
         _register_option(
@@ -145,6 +177,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     The background color to show when hovering over a Pandas Checks table`.
     """,
             validator=cf.is_instance_factory(dict),
+            cb=_sync_format,
         )
     if "use_emojis" in option_keys or options == None:
         _register_option(
@@ -155,6 +188,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     Whether Pandas Checks `check_names` text should keep emojis. This includes default check_names from the factory and user-supplied check_names`.
     """,
             validator=cf.is_instance_factory(bool),
+            cb=_sync_format,
         )
     if "indent_table_terminal" in option_keys or options == None:
         _register_option(
@@ -165,6 +199,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     Number of spaces to indent Pandas Checks tables in terminal display.
     """,
             validator=cf.is_instance_factory(int),
+            cb=_sync_format,
         )
     if "indent_table_plot_ipython" in option_keys or options == None:
         _register_option(
@@ -175,6 +210,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     Number of pixels to indent Pandas Checks tables or plots in IPython/Jupyter display.
     """,
             validator=cf.is_instance_factory(int),
+            cb=_sync_format,
         )
     # Text styling
     if "check_text_tag" in option_keys or options == None:
@@ -186,6 +222,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     A single HTML tag (h1, h5, p, etc) that Pandas Checks will use when displaying results that are lines of text.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
     if "table_title_tag" in option_keys or options == None:
@@ -197,6 +234,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     A single HTML tag (h1, h5, p, etc) that Pandas Checks will use for the titles of tables.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
     if "plot_title_tag" in option_keys or options == None:
@@ -208,6 +246,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     A single HTML tag (h1, h5, p, etc) that Pandas Checks will use for the titles of plots and histograms.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
     if "fail_message_fg_color" in option_keys or options == None:
@@ -219,6 +258,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     The foreground color that Pandas Checks will use for the lead-in text when assert_data() fails.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
     if "fail_message_bg_color" in option_keys or options == None:
@@ -230,6 +270,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     The background color that Pandas Checks will use for the lead-in text when assert_data() fails.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
     if "pass_message_fg_color" in option_keys or options == None:
@@ -241,6 +282,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     The foreground color that Pandas Checks will use for the lead-in text when assert_data() passes.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
     if "pass_message_bg_color" in option_keys or options == None:
@@ -252,6 +294,7 @@ def _initialize_format_options(options: Union[List[str], None] = None) -> None:
     The background color that Pandas Checks will use for the lead-in text when assert_data() passes.
     """,
             validator=cf.is_instance_factory(str),
+            cb=_sync_format,
         )
 
 
@@ -289,10 +332,31 @@ def get_mode() -> Dict[str, bool]:
     Returns:
         A dictionary containing the current settings.
     """
-    return {
-        "enable_checks": pd.get_option("pdchecks.enable_checks"),
-        "enable_asserts": pd.get_option("pdchecks.enable_asserts"),
-    }
+    return dict(_MODE)
+
+
+def _sync_mode(option: str) -> None:
+    """Copies the value of a mode option into the _MODE cache. Called by Pandas whenever the option is set.
+
+    Args:
+        option: The full name of the option, such as "pdchecks.enable_checks".
+
+    Returns:
+        None
+    """
+    _MODE[option.replace("pdchecks.", "")] = pd.get_option(option)
+
+
+def _sync_write(option: str) -> None:
+    """Copies the value of a write option into the _WRITE cache. Called by Pandas whenever the option is set.
+
+    Args:
+        option: The full name of the option, such as "pdchecks.async_writes".
+
+    Returns:
+        None
+    """
+    _WRITE[option.replace("pdchecks.", "")] = pd.get_option(option)
 
 
 def enable_checks(enable_asserts: bool = True) -> None:
@@ -349,6 +413,7 @@ def _initialize_options() -> None:
     This option does not affect .check.assert_data(). Use separate option: `pdchecks.enable_asserts`
     """,
         validator=cf.is_instance_factory(bool),
+        cb=_sync_mode,
     )
     _register_option(
         name="enable_asserts",
@@ -358,6 +423,18 @@ def _initialize_options() -> None:
     Global setting for Pandas Checks to run .check.assert_data() methods. Set to False to disable assertions
     """,
         validator=cf.is_instance_factory(bool),
+        cb=_sync_mode,
+    )
+    _register_option(
+        name="async_writes",
+        default_value=False,
+        description="""
+    : bool
+    Whether .check.write() exports files in a background thread and returns immediately, instead of waiting for the file to be written.
+    Run pandas_checks.wait_for_writes() to wait for pending writes. Errors from background writes are raised by the next write, by wait_for_writes(), or when Python exits.
+    """,
+        validator=cf.is_instance_factory(bool),
+        cb=_sync_write,
     )
     # Register default format options
     _initialize_format_options()
@@ -3,12 +3,27 @@
 from typing import Any, Callable, List, Union
 
 from .display import _display_check
-from .options import get_mode
+from .options import _MODE
+
+
+def _identity(data: Any) -> Any:
+    """The default `fn` for checks: returns the data unchanged.
+
+    Args:
+        data: May be any Pandas DataFrame, Series, string, or other variable
+
+    Returns:
+        The same data object.
+
+    Note:
+        Checks compare `fn` against this function by identity to skip applying it.
+    """
+    return data
 
 
 def _apply_modifications(
     data: Any,
-    fn: Callable = lambda df: df,
+    fn: Callable = _identity,
     subset: Union[str, List, None] = None,
 ) -> Any:
     """Applies user's modifications to a data object.
@@ -25,13 +40,15 @@ def _apply_modifications(
         raise TypeError(
             f"Expected lambda function for argument `fn` (callable type), but received type {type(fn)}"
         )
+    if fn is _identity:  # Nothing to apply
+        return data[subset] if subset else data
     return fn(data)[subset] if subset else fn(data)
 
 
 def _check_data(
     data: Any,
-    check_fn: Callable = lambda df: df,
-    modify_fn: Callable = lambda df: df,
+    check_fn: Callable = _identity,
+    modify_fn: Callable = _identity,
     subset: Union[str, List, None] = None,
     check_name: Union[str, None] = None,
 ) -> None:
@@ -47,17 +64,16 @@ def _check_data(
     Returns:
         None
     """
-    if get_mode()["enable_checks"]:
+    if _MODE["enable_checks"]:
+        # 1. First apply user's modifications to the data before checking it.
+        data = _apply_modifications(data, fn=modify_fn, subset=subset)
         (
             # 3. Report the result
             _display_check(
                 # 2. After applying the method's operation to the data,
-                # like value_counts() or dtypes. May return a DF, an int, etc
-                check_fn(
-                    # 1. After first applying user's modifications to the data
-                    # before checking it.
-                    _apply_modifications(data, fn=modify_fn, subset=subset)
-                ),
+                # like value_counts() or dtypes. May return a DF, an int, etc.
+                # Checks that show the data itself don't need a function call
+                data if check_fn is _identity else check_fn(data),
                 name=check_name if check_name else str(subset) if subset else None,
             )
         )
@@ -9,7 +9,7 @@ from typing import Union
 import numpy as np
 
 from .display import _display_line
-from .options import get_mode
+from .options import _MODE
 
 
 # Public functions
@@ -22,7 +22,7 @@ def start_timer(verbose: bool = False) -> float:
     Returns:
         Timestamp as a float
     """
-    if not get_mode()["enable_checks"]:
+    if not _MODE["enable_checks"]:
         return np.nan
     t = time()
     if verbose:
@@ -54,7 +54,7 @@ def print_time_elapsed(
         so they're exposed to the user.
     """
 
-    if get_mode()["enable_checks"]:
+    if _MODE["enable_checks"]:
         if start_time == np.nan:
             _display_line("Timer hasn't been started. Call start_timer() first")
         elapsed = time() - start_time
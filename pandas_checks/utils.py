@@ -1,14 +1,117 @@
 """
 Utility functions for the pandas_checks package.
 """
+import ast
+import atexit
+import linecache
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from inspect import getsourcelines
-from typing import Any, Callable, Type, Union
+from types import CodeType
+from typing import Any, Callable, Dict, List, Tuple, Type, Union
 
+import numpy as np
 import pandas as pd
 from pandas.core.groupby.groupby import DataError
 
-from .display import _display_line
+from .display import _display_check, _display_line
+from .options import _FORMAT, _WRITE
+
+# Generic types that can be checked by comparing the one-character dtype kind code,
+# which also covers the types' sized and timezone-aware variants.
+# Maps type -> the dtype kinds that satisfy it
+_DTYPE_KINDS: Dict[Any, str] = {
+    int: "iu",
+    float: "f",
+    datetime: "M",
+    "datetime": "M",
+    "date": "M",
+    timedelta: "m",
+    "timedelta": "m",
+}
+
+# Prefixes of default check names that include a dynamic value
+_HEAD_TITLE_PREFIX = "⬆️ First "
+_TAIL_TITLE_PREFIX = "⬇️ Last "
+
+
+def _parse_lambdas(filename: str) -> Dict[int, List[Tuple[Tuple[str, ...], str]]]:
+    """Find the source code of every lambda function in a file, by line number.
+
+    Args:
+        filename: The name of the file (or IPython cell) to parse, as found in a code object.
+
+    Returns:
+        A dictionary of line numbers to a list of (argument names, source code) of the lambdas that start on that line.
+            Empty if the file's source isn't available or can't be parsed.
+
+    Note:
+        Checks first whether the file has changed since linecache read it, such as after a module is reloaded.
+    """
+    linecache.checkcache(filename)
+    linecache.getlines(filename)  # Read the file into linecache, if it isn't there yet
+    entry = linecache.cache.get(filename)
+    # Size, modification time and line list identify the version of the source that linecache holds
+    version = (entry[0], entry[1], id(entry[2])) if entry and len(entry) == 4 else None
+    return _parse_source_lambdas(filename, version)
+
+
+@lru_cache(maxsize=32)
+def _parse_source_lambdas(
+    filename: str, version: Any
+) -> Dict[int, List[Tuple[Tuple[str, ...], str]]]:
+    """Parses the lambdas in one version of a file. Cached, so each version of a file is only parsed once.
+
+    Args:
+        filename: The name of the file (or IPython cell) to parse, as found in a code object.
+        version: Identifies the version of the file's source in linecache. Only used as part of the cache key.
+
+    Returns:
+        A dictionary of line numbers to a list of (argument names, source code) of the lambdas that start on that line.
+            Empty if the file's source isn't available or can't be parsed.
+    """
+    lambdas: Dict[int, List[Tuple[Tuple[str, ...], str]]] = {}
+    source = "".join(linecache.getlines(filename))
+    try:
+        tree = ast.parse(source) if source else None
+    except (SyntaxError, ValueError):
+        tree = None
+    if tree is not None:
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Lambda):
+                segment = ast.get_source_segment(source, node)
+                if segment:
+                    args = node.args
+                    arg_names = tuple(
+                        arg.arg for arg in getattr(args, "posonlyargs", []) + args.args
+                    )
+                    lambdas.setdefault(node.lineno, []).append((arg_names, segment))
+    return lambdas
+
+
+def _code_to_string(code: CodeType) -> str:
+    """Create a string representation of a function from its code object.
+
+    Args:
+        code: The function's code object, from its `__code__` attribute.
+
+    Returns:
+        The source of the lambda, if it can be located unambiguously. Else, the source lines that contain the function.
+    """
+    if code.co_name == "<lambda>":
+        arg_names = code.co_varnames[: code.co_argcount]
+        matches = [
+            segment
+            for candidate_arg_names, segment in _parse_lambdas(code.co_filename).get(
+                code.co_firstlineno, []
+            )
+            if candidate_arg_names == arg_names
+        ]
+        if len(matches) == 1:
+            return matches[0]
+    return "".join(getsourcelines(code)[0]).lstrip(" .")
 
 
 def _lambda_to_string(lambda_func: Callable) -> str:
@@ -20,14 +123,86 @@ def _lambda_to_string(lambda_func: Callable) -> str:
     Returns:
         A string version of lambda_func
 
-    Todo:
-        This still returns all arguments to the calling function.
-            They get entangled with the argument when it's a lambda function.
-            Try other ways to get just the argument we want.
+    Note:
+        Each version of a source file is parsed once and its lambdas are cached, so repeated asserts don't re-parse the file.
+            Results aren't cached by code object, since code objects from different files or versions of a file can compare equal.
+            If the lambda can't be located unambiguously (for example, it was defined in a plain REPL),
+            falls back to the source lines that contain the function.
     """
+    code = getattr(lambda_func, "__code__", None)
+    if code is not None:
+        return _code_to_string(code)
     return "".join(getsourcelines(lambda_func)[0]).lstrip(" .")
 
 
+def _report_assertion(
+    result: bool,
+    fail_message: str,
+    pass_message: str,
+    raise_exception: bool = True,
+    exception_to_raise: Type[BaseException] = DataError,
+    verbose: bool = False,
+    condition_str: Union[str, None] = None,
+) -> None:
+    """Raises or displays the outcome of an assertion whose result is already known.
+
+    Args:
+        result: Whether the assertion passed.
+        fail_message: Message to display if the assertion failed.
+        pass_message: Message to display if the assertion passed.
+        raise_exception: Whether to raise an exception if the assertion failed.
+        exception_to_raise: The exception to raise if the assertion failed and raise_exception is True.
+        verbose: Whether to display the pass message if the assertion passed.
+        condition_str: Optional text of the assertion criteria, to show with the message. If None, only the message is shown.
+
+    Returns:
+        None
+    """
+    # Fail
+    if not result:
+        if raise_exception:
+            raise exception_to_raise(
+                fail_message + " :" + condition_str if condition_str else fail_message
+            )
+        else:
+            if condition_str is not None:
+                _display_line(
+                    lead_in=fail_message,
+                    line=condition_str,
+                    colors={
+                        "lead_in_text_color": _FORMAT["fail_message_fg_color"],
+                        "lead_in_background_color": _FORMAT["fail_message_bg_color"],
+                    },
+                )
+            else:
+                _display_line(
+                    line=fail_message,
+                    colors={
+                        "text_color": _FORMAT["fail_message_fg_color"],
+                        "text_background_color": _FORMAT["fail_message_bg_color"],
+                    },
+                )
+    # Pass
+    if result and verbose:
+        if condition_str is not None:
+            _display_line(
+                lead_in=pass_message,
+                line=condition_str,
+                colors={
+                    "lead_in_text_color": _FORMAT["pass_message_fg_color"],
+                    "lead_in_background_color": _FORMAT["pass_message_bg_color"],
+                },
+            )
+        else:
+            _display_line(
+                line=pass_message,
+                colors={
+                    "text_color": _FORMAT["pass_message_fg_color"],
+                    "text_background_color": _FORMAT["pass_message_bg_color"],
+                },
+            )
+
+
 def _has_nulls(
     data: Union[pd.DataFrame, pd.Series],
     fail_message: str,
@@ -36,7 +211,7 @@ def _has_nulls(
 ) -> bool:
     """Utility function to check for nulls as part of a larger check"""
     if isinstance(data, pd.DataFrame):
-        has_nulls = data.isna().any().any()
+        has_nulls = data.isna().any(axis=None)
     elif isinstance(data, pd.Series):
         has_nulls = data.isna().any()
     else:
@@ -52,31 +227,98 @@ def _has_nulls(
                 lead_in=fail_message,
                 line="Nulls present (to disable, pass `assert_no_nulls=False`)",
                 colors={
-                    "lead_in_text_color": pd.get_option(
-                        "pdchecks.fail_message_fg_color"
-                    ),
-                    "lead_in_background_color": pd.get_option(
-                        "pdchecks.fail_message_bg_color"
-                    ),
+                    "lead_in_text_color": _FORMAT["fail_message_fg_color"],
+                    "lead_in_background_color": _FORMAT["fail_message_bg_color"],
                 },
             )
     return has_nulls
 
 
+def _arrow_null_counts(data: pd.DataFrame) -> Union[pd.Series, None]:
+    """Count the nulls in each column of a DataFrame whose columns are all backed by Arrow.
+
+    Args:
+        data: The DataFrame to count nulls in.
+
+    Returns:
+        A Series of null counts per column, the same as `data.isna().sum()`, or None if any column isn't an ArrowDtype.
+
+    Note:
+        Arrow arrays track their own null count, so this avoids building a boolean mask for each column.
+    """
+    arrow_dtype = getattr(pd, "ArrowDtype", None)  # Added in pandas 1.5
+    if (
+        arrow_dtype is None
+        or data.shape[1] == 0
+        or not all(isinstance(dtype, arrow_dtype) for dtype in data.dtypes)
+    ):
+        return None
+    return pd.Series(
+        [col.array.__arrow_array__().null_count for _, col in data.items()],
+        index=data.columns,
+        dtype="int64",
+    )
+
+
+def _series_null_count(s: pd.Series) -> int:
+    """Count the nulls in a Series.
+
+    Args:
+        s: The Series to count nulls in.
+
+    Returns:
+        The number of nulls, the same as `s.isna().sum()`.
+
+    Note:
+        If the Series is backed by Arrow, reads the array's own null count instead of building a boolean mask.
+    """
+    arrow_dtype = getattr(pd, "ArrowDtype", None)  # Added in pandas 1.5
+    if arrow_dtype is not None and isinstance(s.dtype, arrow_dtype):
+        return s.array.__arrow_array__().null_count
+    return s.isna().sum()
+
+
+def _all_satisfy(
+    s: pd.Series, comparison: Callable, threshold: Any, skipna: bool = True
+) -> bool:
+    """Tests whether every value in a Series compares True against a threshold.
+
+    Args:
+        s: The Series to test.
+        comparison: A comparison operator, such as operator.gt.
+        threshold: The value to compare each element against. If it's a Series, it's compared by label.
+        skipna: Whether to ignore null values. If False, a null value fails the comparison.
+
+    Returns:
+        True if `comparison(value, threshold)` is True for all values.
+
+    Note:
+        For NumPy numeric dtypes and a scalar threshold, compares the underlying array in one pass,
+            without building an intermediate Series or copying the data with dropna().
+            Other thresholds are compared by Pandas, which raises ValueError if a Series threshold's labels don't match.
+    """
+    if (
+        pd.api.types.is_scalar(threshold)
+        and isinstance(s.dtype, np.dtype)
+        and s.dtype.kind in "iufb"
+    ):
+        values = s.to_numpy(copy=False)
+        if skipna and s.dtype.kind == "f" and s.hasnans:
+            values = values[~np.isnan(values)]
+        return bool(comparison(values, threshold).all())
+    return bool(comparison(s.dropna() if skipna else s, threshold).all())
+
+
 def _series_is_type(s: pd.Series, dtype: Type[Any]) -> bool:
     """Utility function to check if a series has an expected type.
     Includes special handling for strings, since 'object' type in Pandas
     may not mean a string"""
     if dtype in [str, "str"]:
         return pd.api.types.is_string_dtype(s)
-    elif dtype in [datetime, "datetime", "date"]:
-        return pd.api.types.is_datetime64_any_dtype(
-            s
-        ) or pd.api.types.is_datetime64tz_dtype(s)
-    elif dtype in [timedelta, "timedelta"]:
-        return pd.api.types.is_timedelta64_dtype(s)
-    else:
-        return s.dtypes == dtype
+    kinds = _DTYPE_KINDS.get(dtype) if isinstance(dtype, (type, str)) else None
+    if kinds:
+        return s.dtype.kind in kinds
+    return s.dtypes == dtype
 
 
 def _is_type(data: pd.DataFrame, dtype: Type[Any]) -> bool:
@@ -86,3 +328,366 @@ def _is_type(data: pd.DataFrame, dtype: Type[Any]) -> bool:
     if isinstance(data, pd.Series):
         return _series_is_type(data, dtype)
     return all([_series_is_type(data[col], dtype) for col in data.columns])
+
+
+def _as_frame(data: Any) -> Any:
+    """Wraps a Series in a one-column DataFrame for display, the way a check of a DataFrame shows its result.
+
+    Args:
+        data: The result of a check, such as a Series or DataFrame.
+
+    Returns:
+        The data as a DataFrame if it's a Series. Else, the data unchanged.
+    """
+    return data.to_frame() if isinstance(data, pd.Series) else data
+
+
+def _head_rows(data: Union[pd.DataFrame, pd.Series], n: int) -> Any:
+    """Selects the first rows of a DataFrame or Series, like Pandas head(). Shared by the head() checks.
+
+    Args:
+        data: The data to select rows from.
+        n: The number of rows to select.
+
+    Returns:
+        The first `n` rows of `data`.
+
+    Note:
+        Slices with iloc rather than head(), which copies the rows under copy-on-write.
+            And doesn't slice at all if we're showing every row.
+    """
+    return data if n >= len(data) else data.iloc[:n]
+
+
+def _tail_rows(data: Union[pd.DataFrame, pd.Series], n: int) -> Any:
+    """Selects the last rows of a DataFrame or Series, like Pandas tail(). Shared by the tail() checks.
+
+    Args:
+        data: The data to select rows from.
+        n: The number of rows to select.
+
+    Returns:
+        The last `n` rows of `data`.
+
+    Note:
+        Slices with iloc for the same reasons as _head_rows().
+    """
+    return data if n >= len(data) else data.iloc[-n:] if n else data.iloc[:0]
+
+
+@lru_cache(maxsize=128, typed=True)
+def _series_label(prefix: str, series_name: Any) -> str:
+    """Builds a default check name that ends with the name of a Series. Cached, since the same Series tend to be checked repeatedly.
+
+    Args:
+        prefix: The start of the check name.
+        series_name: The name of the Series, or None.
+
+    Returns:
+        The check name.
+    """
+    return f"{prefix}{series_name if series_name else 'series'}"
+
+
+def _series_unique(
+    s: pd.Series,
+    check_name: Union[str, None] = None,
+    series_name: Union[str, None] = None,
+) -> None:
+    """Displays the unique values in a Series. Shared by SeriesChecks.unique() and DataFrameChecks.unique().
+
+    Args:
+        s: The Series to check, after the user's modifications.
+        check_name: An optional name for the check, to be printed as preface to the result.
+        series_name: The name of the Series to use in the default check name. If None, uses the name of `s`.
+
+    Returns:
+        None
+    """
+    series_name = series_name if series_name is not None else s.name
+    _display_check(
+        s.unique().tolist(),
+        name=check_name
+        if check_name
+        else _series_label("🌟 Unique values of ", series_name),
+    )
+
+
+def _series_memory_usage(
+    s: pd.Series, index: bool = True, deep: bool = False
+) -> pd.Series:
+    """Measures the memory footprint of a Series, itemized like DataFrame.memory_usage() does for a DataFrame.
+
+    Args:
+        s: The Series to measure.
+        index: Whether to include the memory usage of the index.
+        deep: Whether to measure the memory of object values more thoroughly.
+
+    Returns:
+        The memory usage in bytes of the index (if `index` is True) and of the values, labeled by the Series name.
+    """
+    usage = pd.Series(
+        [s.memory_usage(index=False, deep=deep)],
+        index=pd.Index([s.name if s.name is not None else 0]),
+    )
+    if index:
+        usage = pd.concat(
+            [pd.Series([s.index.memory_usage(deep=deep)], index=["Index"]), usage]
+        )
+    return usage
+
+
+def _top_value_counts(s: pd.Series, n: int, **kwargs: Any) -> pd.Series:
+    """Counts the values of a Series and returns the `n` most (or least) frequent, in sorted order.
+
+    Finds the cutoff count with a partial sort, then sorts only the values that make the cut, instead of sorting every unique value's count only to keep the first `n`.
+
+    Args:
+        s: The Series to count.
+        n: The number of values to return. Must be positive.
+        **kwargs: Optional, additional arguments that are accepted by Pandas value_counts() method.
+
+    Returns:
+        The counts of the top `n` values, labeled by value.
+
+    Note:
+        Values with tied counts are kept in order of first appearance, so ties at the cutoff are
+            broken the same way every time. This matches value_counts().head(n) whenever Pandas's
+            sort keeps ties in order, which it does for small numbers of unique values.
+    """
+    if not kwargs.get("sort", True):
+        return s.value_counts(**kwargs).head(n)
+    ascending = kwargs.get("ascending", False)
+    counts = s.value_counts(**{**kwargs, "sort": False})  # In order of first appearance
+    if n >= len(counts):
+        return counts.sort_values(ascending=ascending)
+    values = counts.to_numpy()
+    sort_keys = values if ascending else -values
+    cutoff = np.partition(sort_keys, n - 1)[n - 1]
+    # Keep every value that beats the cutoff, then the earliest values tied at the cutoff
+    keep = sort_keys < cutoff
+    keep[np.flatnonzero(sort_keys == cutoff)[: n - keep.sum()]] = True
+    top = counts[keep]
+    return top.iloc[np.argsort(sort_keys[keep], kind="stable")]
+
+
+def _series_value_counts(
+    s: pd.Series,
+    max_rows: int = 10,
+    check_name: Union[str, None] = None,
+    **kwargs: Any,
+) -> None:
+    """Displays the value counts of a Series. Shared by SeriesChecks.value_counts() and DataFrameChecks.value_counts().
+
+    Args:
+        s: The Series to check, after the user's modifications.
+        max_rows: Maximum number of rows to show in the value counts.
+        check_name: An optional name for the check, to be printed as preface to the result.
+        **kwargs: Optional, additional arguments that are accepted by Pandas value_counts() method.
+
+    Returns:
+        None
+    """
+    _display_check(
+        _top_value_counts(s, max_rows, **kwargs)
+        if max_rows and max_rows > 0
+        else s.value_counts(**kwargs).head(max_rows),
+        name=check_name
+        if check_name
+        else f"🧮 Value counts, first {max_rows} values"
+        if max_rows
+        else f"🧮 Value counts",
+    )
+
+
+@lru_cache(maxsize=64)
+def _clean_dtype_label(dtype_str: str) -> str:
+    """Formats a type for display in a message. Cached, since the same types tend to be asserted repeatedly.
+
+    Args:
+        dtype_str: The type to format, as a string. Keyed on the string so that unhashable types can be formatted too.
+
+    Returns:
+        The type as a string, without the "<class '...'>" wrapping, which gets blanked out in our HTML display.
+    """
+    return dtype_str.replace("<class", "").replace(">", "").replace("'", "")
+
+
+def _type_fail_message(dtype: Type[Any], found_dtype: Any) -> str:
+    """Builds the default fail message of a type assertion.
+
+    Args:
+        dtype: The expected type.
+        found_dtype: The observed dtype, or a comma-separated list of observed dtypes.
+
+    Returns:
+        The fail message.
+    """
+    return f" ㄨ Assert type failed: expected {_clean_dtype_label(str(dtype))}, got {found_dtype}"
+
+
+# File formats supported by write(): format -> (Pandas export method, default kwargs)
+_WRITE_FORMATS = {
+    "csv": ("to_csv", {}),
+    "feather": ("to_feather", {"compression": "zstd"}),
+    "parquet": ("to_parquet", {}),
+    "pickle": ("to_pickle", {}),
+    "tsv": ("to_csv", {"sep": "\t"}),
+    "xlsx": ("to_excel", {}),
+}
+# Other names for the formats above, whether passed as `format` or found as a file extension
+_WRITE_FORMAT_ALIASES = {"excel": "xlsx", "pkl": "pickle", "xls": "xlsx"}
+
+# Background writes, used when the option pdchecks.async_writes is True
+_WRITE_POOL: Union[ThreadPoolExecutor, None] = None
+_PENDING_WRITES: List[Tuple[str, Future]] = []
+
+
+def _raise_write_failures(failures: List[Tuple[str, BaseException]]) -> None:
+    """Raises the errors of failed background writes, if any.
+
+    Args:
+        failures: The path and error of each failed write.
+
+    Returns:
+        None
+
+    Raises:
+        Exception: The error raised by a background write, if exactly one failed.
+        RuntimeError: If more than one background write failed. Lists every failed path and its error.
+    """
+    if len(failures) == 1:
+        raise failures[0][1]
+    if failures:
+        raise RuntimeError(
+            f"{len(failures)} background writes failed:\n"
+            + "\n".join(f"{path}: {error!r}" for path, error in failures)
+        ) from failures[0][1]
+
+
+def wait_for_writes() -> None:
+    """Blocks until all background writes are finished. Use when the option pdchecks.async_writes is True, such as before reading a file back.
+
+    Returns:
+        None
+
+    Raises:
+        Exception: The error raised by a background write, if exactly one failed.
+        RuntimeError: If more than one background write failed. Lists every failed path and its error.
+    """
+    failures: List[Tuple[str, BaseException]] = []
+    while _PENDING_WRITES:
+        path, future = _PENDING_WRITES.pop(0)
+        error = future.exception()
+        if error is not None:
+            failures.append((path, error))
+    _raise_write_failures(failures)
+
+
+def _check_finished_writes() -> None:
+    """Forgets background writes that have finished, and raises the errors of any that failed.
+
+    Returns:
+        None
+
+    Raises:
+        Exception: The error raised by a background write, if exactly one failed.
+        RuntimeError: If more than one background write failed. Lists every failed path and its error.
+    """
+    failures: List[Tuple[str, BaseException]] = []
+    pending: List[Tuple[str, Future]] = []
+    for path, future in _PENDING_WRITES:
+        if not future.done():
+            pending.append((path, future))
+            continue
+        error = future.exception()
+        if error is not None:
+            failures.append((path, error))
+    _PENDING_WRITES[:] = pending
+    _raise_write_failures(failures)
+
+
+def _submit_write(write_fn: Callable, path: str, kwargs: Dict[str, Any]) -> None:
+    """Runs a Pandas export function in a background thread.
+
+    Args:
+        write_fn: The bound Pandas export method, such as `df.to_csv`.
+        path: Path to write the file to.
+        kwargs: Keyword arguments to pass to `write_fn`.
+
+    Returns:
+        None
+
+    Note:
+        Writes run one at a time, in the order they were submitted, so the last write to a path wins.
+    """
+    global _WRITE_POOL
+    if _WRITE_POOL is None:
+        _WRITE_POOL = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pandas_checks_write"
+        )
+        atexit.register(wait_for_writes)
+    _PENDING_WRITES.append((path, _WRITE_POOL.submit(write_fn, path, **kwargs)))
+
+
+def _resolve_write_format(path: str, format: Union[str, None] = None) -> str:
+    """Determines the file format to export data in.
+
+    Args:
+        path: Path to write the file to.
+        format: Optional file format to force for the export. If None, format is inferred from the file's extension in `path`, or is Feather if there's no extension.
+
+    Returns:
+        The format, as a key in _WRITE_FORMATS.
+
+    Raises:
+        AttributeError: If the format isn't supported.
+    """
+    format_clean = (
+        format.lower().replace(".", "").strip()
+        if format
+        else os.path.splitext(path)[1].lstrip(".").lower() or "feather"
+    )
+    format_clean = _WRITE_FORMAT_ALIASES.get(format_clean, format_clean)
+    if format_clean not in _WRITE_FORMATS:
+        raise AttributeError(
+            f"Can't write data to file. Unsupported format: {format}. Supported formats: {', '.join(_WRITE_FORMATS)}"
+            if format
+            else f"Can't write data to file. Unknown file extension in: {path}. "
+        )
+    return format_clean
+
+
+def _write_data(
+    data: pd.DataFrame, path: str, format: str, verbose: bool = False, **kwargs: Any
+) -> None:
+    """Exports data to a file with the corresponding Pandas export function. Shared by DataFrameChecks.write() and SeriesChecks.write().
+
+    Args:
+        data: The data to export.
+        path: Path to write the file to.
+        format: The file format, as returned by _resolve_write_format().
+        verbose: Whether to print a message when the file is written.
+        **kwargs: Optional, additional keyword arguments to pass to the Pandas export function.
+
+    Returns:
+        None
+
+    Raises:
+        Exception: The error of an earlier background write that failed since the last write.
+    """
+    _check_finished_writes()
+    method, default_kwargs = _WRITE_FORMATS[format]
+    if _WRITE["async_writes"]:
+        # Copy, so changes made to the original after write() returns don't reach the export
+        _submit_write(
+            getattr(data.copy(), method),
+            path,
+            {**default_kwargs, **kwargs},
+        )
+        if verbose:
+            _display_line(f"📦 Writing file {path} in the background")
+    else:
+        getattr(data, method)(path, **{**default_kwargs, **kwargs})
+        if verbose:
+            _display_line(f"📦 Wrote file {path}")
@@ -4,7 +4,14 @@ import pytest
 from pandas.core.groupby.groupby import DataError
 from pytest_cases import parametrize_with_cases
 
-from pandas_checks import disable_checks, enable_checks, reset_format, start_timer
+from pandas_checks import (
+    disable_checks,
+    enable_checks,
+    reset_format,
+    start_timer,
+    utils,
+    wait_for_writes,
+)
 
 
 # Helper function
@@ -177,6 +184,15 @@ def test_DataFrameChecks_nnulls(iris, capsys):
     assert capsys.readouterr().out == "\nTest: 150\n"
 
 
+def test_DataFrameChecks_nnulls_arrow(iris, capsys):
+    """Test that Arrow-backed columns report the same null counts as NumPy-backed ones"""
+    df = iris.assign(species=iris["species"].replace("setosa", None))
+    df.check.nnulls(check_name="Test")
+    expected = capsys.readouterr().out
+    df.convert_dtypes(dtype_backend="pyarrow").check.nnulls(check_name="Test")
+    assert capsys.readouterr().out == expected
+
+
 def test_DataFrameChecks_nrows(iris, capsys):
     iris.check.nrows(
         fn=lambda df: df.assign(C=55), check_name="Test", subset=["C", "species"]
@@ -389,3 +405,76 @@ def test_DataFrameChecks_write(iris, format_extension, tmp_path, capsys):
         assert_equal_df(f(iris), pd.read_pickle(path))
     elif extension == "tsv":
         assert_equal_df(f(iris), pd.read_csv(path, sep="\t", index_col=0))
+
+
+def test_DataFrameChecks_write_no_extension(iris, tmp_path):
+    """Test that a path without an extension is written as Feather"""
+    path = f"{tmp_path}/test"
+    iris.check.write(path=path)
+    assert_equal_df(iris, pd.read_feather(path))
+
+
+def test_DataFrameChecks_write_unknown_extension(iris, tmp_path):
+    def fn(df):
+        raise AssertionError("fn should not run when the format is unknown")
+
+    with pytest.raises(AttributeError):
+        iris.check.write(path=f"{tmp_path}/test.unknown", fn=fn)
+
+
+def test_DataFrameChecks_write_unknown_format(iris, tmp_path):
+    """An unsupported `format` should be named in the error, not the path's extension"""
+    with pytest.raises(AttributeError, match="Unsupported format: docx"):
+        iris.check.write(path=f"{tmp_path}/test.csv", format="docx")
+
+
+def test_DataFrameChecks_write_async(iris, tmp_path, capsys):
+    path = f"{tmp_path}/test.csv"
+    with pd.option_context("pdchecks.async_writes", True):
+        iris.check.write(path=path, index=False, verbose=True)
+    assert capsys.readouterr().out == f"\n📦 Writing file {path} in the background\n"
+    wait_for_writes()
+    assert_equal_df(iris, pd.read_csv(path))
+
+
+def test_DataFrameChecks_write_async_failures(iris, tmp_path):
+    """Every failed background write should be reported, not just the first"""
+    paths = [f"{tmp_path}/missing_{i}/test.csv" for i in range(2)]
+    with pd.option_context("pdchecks.async_writes", True):
+        for path in paths:
+            iris.check.write(path=path)
+    with pytest.raises(RuntimeError, match="2 background writes failed") as error:
+        wait_for_writes()
+    assert all(path in str(error.value) for path in paths)
+    wait_for_writes()  # Failures are only reported once
+
+
+def test_DataFrameChecks_write_async_same_path_in_order(iris, tmp_path):
+    """The last background write to a path should win"""
+    path = f"{tmp_path}/test.csv"
+    with pd.option_context("pdchecks.async_writes", True):
+        pd.concat([iris] * 200).check.write(path=path, index=False)
+        iris.check.write(path=path, index=False)
+    wait_for_writes()
+    assert_equal_df(iris, pd.read_csv(path))
+
+
+def test_DataFrameChecks_write_async_copies_data(iris, tmp_path):
+    """Changing the DataFrame after write() returns shouldn't change the file"""
+    path = f"{tmp_path}/test.csv"
+    expected = iris.copy()
+    with pd.option_context("pdchecks.async_writes", True):
+        iris.check.write(path=path, index=False)
+    iris.loc[:, "sepal_length"] = -1.0
+    wait_for_writes()
+    assert_equal_df(expected, pd.read_csv(path))
+
+
+def test_DataFrameChecks_write_async_failure_raised_by_next_write(iris, tmp_path):
+    with pd.option_context("pdchecks.async_writes", True):
+        iris.check.write(path=f"{tmp_path}/missing/test.csv")
+    # Let the failed write finish, without collecting its error
+    utils._PENDING_WRITES[-1][1].exception()
+    with pytest.raises(OSError):
+        iris.check.write(path=f"{tmp_path}/test.csv")
+    wait_for_writes()  # The failure was already reported
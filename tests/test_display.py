@@ -1,3 +1,7 @@
+import textwrap
+
+import numpy as np
+import pandas as pd
 import pytest
 
 import pandas_checks as pdc
@@ -6,6 +10,7 @@ from pandas_checks.display import (
     _filter_emojis,
     _format_background_color,
     _lead_in,
+    _print_table_terminal,
     _warning,
 )
 
@@ -17,6 +22,7 @@ def test_filter_emojis():
     assert _filter_emojis(original) == original
     pdc.set_format(use_emojis=False)
     assert _filter_emojis(original) == no_emojis
+    assert _filter_emojis(np.int64(1)) == "1"
     pdc.set_format(use_emojis=True)  # Reset for later tests
 
 
@@ -56,3 +62,16 @@ def test_display_line(capsys):
 def test_warning(capsys):
     _warning("Test warning", "🐼🩺 Pandas Checks warning", True)
     assert capsys.readouterr().out == f"\n🐼🩺 Pandas Checks warning: Test warning\n"
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        pd.DataFrame({"a": [1, 2], "b": [3.5, None]}),
+        pd.DataFrame({"": [1, 2], " ": [3, 4]}),  # Header line is blank
+        pd.Series(["", " "], index=["", " "]),  # Data lines are blank
+    ],
+)
+def test_print_table_terminal(table, capsys):
+    _print_table_terminal(table)
+    assert capsys.readouterr().out == textwrap.indent(table.to_string(), "    ") + "\n"
@@ -55,3 +55,13 @@ def test_register_option_existing():
     options._set_option("precision", 17)
     options._register_option("precision", 10, "", lambda x: isinstance(x, int))
     assert pd.get_option("pdchecks.precision") == 10
+
+
+def test_get_mode_follows_pandas_options():
+    pd.set_option("pdchecks.enable_checks", False)
+    assert options.get_mode()["enable_checks"] == False
+    with pd.option_context("pdchecks.enable_asserts", False):
+        assert options.get_mode()["enable_asserts"] == False
+    assert options.get_mode()["enable_asserts"] == True
+    pd.reset_option("pdchecks.enable_checks")
+    assert options.get_mode()["enable_checks"] == True
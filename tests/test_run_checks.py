@@ -2,7 +2,7 @@ import pandas as pd
 import pytest
 
 import pandas_checks as pdc
-from pandas_checks.run_checks import _apply_modifications, _check_data
+from pandas_checks.run_checks import _apply_modifications, _check_data, _identity
 
 
 def test_apply_modifications_lambda():
@@ -30,6 +30,15 @@ def test_apply_modifications_subset():
     pd.testing.assert_frame_equal(result, expected)
 
 
+def test_apply_modifications_identity():
+    df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6], "C": [7, 8, 9]})
+    assert _apply_modifications(df) is df
+    pd.testing.assert_frame_equal(
+        _apply_modifications(df, _identity, ["A", "C"]),
+        pd.DataFrame({"A": [1, 2, 3], "C": [7, 8, 9]}),
+    )
+
+
 def test_apply_modifications_invalid_fn():
     df = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6]})
     fn = 123
@@ -4,7 +4,14 @@ import pytest
 from pandas.core.groupby.groupby import DataError
 from pytest_cases import parametrize_with_cases
 
-from pandas_checks import disable_checks, enable_checks, reset_format, start_timer
+from pandas_checks import (
+    disable_checks,
+    enable_checks,
+    reset_format,
+    set_format,
+    start_timer,
+)
+from pandas_checks.display import _display_check
 
 
 # Helper functions
@@ -101,6 +108,26 @@ def test_SeriesChecks_function(iris, capsys):
     assert capsys.readouterr().out == """\nTest: 150\n"""
 
 
+@pytest.mark.parametrize(
+    "method",
+    (
+        lambda s, fn: s.check.describe(fn=fn),
+        lambda s, fn: s.check.head(n=1, fn=fn),
+        lambda s, fn: s.check.print(fn=fn, max_rows=1),
+        lambda s, fn: s.check.tail(n=1, fn=fn),
+    ),
+)
+def test_SeriesChecks_fn_returns_dataframe(iris, capsys, method):
+    """Methods that show a table should accept an fn that turns the Series into a DataFrame"""
+    method(
+        iris["sepal_length"],
+        lambda s: s.to_frame().assign(doubled=s * 2),
+    )
+    output = capsys.readouterr().out
+    assert "sepal_length" in output
+    assert "doubled" in output
+
+
 def test_SeriesChecks_get_mode(iris, capsys):
     iris.check.get_mode(check_name="Test")
     assert (
@@ -124,6 +151,33 @@ def test_SeriesChecks_hist_no_terminal_display(iris, capsys):
     assert capsys.readouterr().out == ""
 
 
+@pytest.mark.parametrize("method", ("hist", "plot"))
+def test_SeriesChecks_plot_leaves_user_figure_alone(iris, monkeypatch, method):
+    """Plots should be drawn on their own figure, not on (and then closing) the user's"""
+    import sys
+
+    import matplotlib.pyplot as plt
+
+    import pandas_checks.display as display_module
+
+    # The package exports a class of the same name, so look the module up directly
+    series_checks_module = sys.modules["pandas_checks.SeriesChecks"]
+
+    # Pretend we're in IPython/Jupyter, but don't render anything
+    monkeypatch.setattr(series_checks_module, "_is_terminal", lambda: False)
+    monkeypatch.setattr(display_module, "_is_terminal", lambda: False)
+    monkeypatch.setattr(display_module, "display", lambda *args, **kwargs: None)
+
+    user_fig, user_ax = plt.subplots()
+    try:
+        getattr(iris["sepal_width"].check, method)()
+        assert plt.fignum_exists(user_fig.number)
+        assert not user_ax.patches and not user_ax.lines
+        assert plt.get_fignums() == [user_fig.number]
+    finally:
+        plt.close(user_fig)
+
+
 def test_SeriesChecks_info(iris, capsys):
     iris["petal_width"].check.info(
         fn=lambda s: (s * 2),
@@ -181,6 +235,24 @@ def test_SeriesChecks_nnulls(iris, capsys):
     assert capsys.readouterr().out == "\nTest: 50\n"
 
 
+@pytest.mark.parametrize("use_emojis", [True, False])
+def test_SeriesChecks_nnulls_no_check_name(iris, capsys, use_emojis):
+    set_format(use_emojis=use_emojis)
+    iris["sepal_length"].check.nnulls(check_name=None)
+    reset_format()
+    assert capsys.readouterr().out == "\nNone: 0\n"
+
+
+def test_SeriesChecks_nnulls_arrow(iris, capsys):
+    """Test that an Arrow-backed Series reports the same null count as a NumPy-backed one"""
+    s = iris["species"].replace("setosa", None)
+    s.check.nnulls(check_name="Test")
+    expected = capsys.readouterr().out
+    s.astype("string[pyarrow]").check.nnulls(check_name="Test")
+    s.convert_dtypes(dtype_backend="pyarrow").check.nnulls(check_name="Test")
+    assert capsys.readouterr().out == expected * 2
+
+
 def test_SeriesChecks_nrows(iris, capsys):
     iris["species"].check.nrows(fn=lambda s: s[s == "versicolor"], check_name="Test")
     assert capsys.readouterr().out == "\nTest: 50\n"
@@ -319,6 +391,17 @@ def test_SeriesChecks_unique(iris, capsys):
     )
 
 
+def test_SeriesChecks_unique_default_name_by_type(capsys):
+    """Series names that compare equal, like 1 and True, should get their own default check names"""
+    for name in (1, True, 1.0):
+        pd.Series([1], name=name).check.unique()
+    assert capsys.readouterr().out == (
+        "\n🌟 Unique values of 1: [1]\n"
+        "\n🌟 Unique values of True: [1]\n"
+        "\n🌟 Unique values of 1.0: [1]\n"
+    )
+
+
 def test_SeriesChecks_value_counts(iris, capsys):
     """Test that kwargs are getting passed to Pandas's value_counts()"""
     iris["species"].check.value_counts(
@@ -337,6 +420,24 @@ def test_SeriesChecks_value_counts(iris, capsys):
     )
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"ascending": True},
+        {"normalize": True},
+        {"dropna": False},
+    ),
+)
+def test_SeriesChecks_value_counts_matches_pandas(capsys, kwargs):
+    """Ties at the max_rows cutoff should keep Pandas's choice and order of values"""
+    s = pd.Series(["h", "g", "c", "f", "b", "e", "b", "g", None], name="letters")
+    s.check.value_counts(max_rows=3, check_name="Test", **kwargs)
+    check_output = capsys.readouterr().out
+    _display_check(s.value_counts(**kwargs).head(3), name="Test")
+    assert check_output == capsys.readouterr().out
+
+
 @pytest.mark.parametrize(
     "format_extension",
     (
@@ -380,3 +481,9 @@ def test_SeriesChecks_write(iris, format_extension, tmp_path, capsys):
         assert_equal_series(
             f(series)["species"], pd.read_csv(path, sep="\t", index_col=0)["species"]
         )
+
+
+def test_SeriesChecks_write_no_extension(iris, tmp_path):
+    path = f"{tmp_path}/test"
+    iris["species"].check.write(path=path)
+    assert_equal_series(iris["species"], pd.read_feather(path)["species"])
@@ -266,6 +266,14 @@ def test_SeriesChecks_assert_timedelta_fail(iris):
         )["mixed_types_timedelta"].check.assert_timedelta()
 
 
+def test_SeriesChecks_assert_greater_than_misaligned_series_fail(iris):
+    """A Series threshold is compared by label, not by position"""
+    with pytest.raises(ValueError):
+        iris["sepal_length"].check.assert_greater_than(
+            pd.Series(0, index=iris.index + 1000)
+        )
+
+
 def test_SeriesChecks_assert_type_pass(iris):
     (iris["sepal_length"].check.assert_type(float))
 
@@ -282,6 +290,11 @@ def test_SeriesChecks_assert_type_mixed_fail(iris):
         )["mixed_types"].check.assert_type(float)
 
 
+def test_SeriesChecks_assert_type_unhashable_fail(iris):
+    with pytest.raises(TypeError, match="Assert type failed"):
+        assert iris["sepal_length"].check.assert_type(["float64"])
+
+
 def test_SeriesChecks_assert_unique_pass(iris):
     (
         iris.assign(unique_col=range(0, iris.shape[0]))[
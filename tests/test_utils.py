@@ -0,0 +1,95 @@
+import linecache
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pandas_checks.utils import _lambda_to_string, _top_value_counts
+
+
+def _pass_through(fn, *args, **kwargs):
+    return fn
+
+
+def test_lambda_to_string_multiline():
+    fn = (
+        lambda df: df.shape[0]
+        > 1
+    )  # fmt: skip
+    assert _lambda_to_string(fn) == "lambda df: df.shape[0]\n        > 1"
+
+
+def test_lambda_to_string_two_on_one_line():
+    first, second = lambda df: df.shape[0] > 1, lambda s: s.sum() < 10
+    assert _lambda_to_string(first) == "lambda df: df.shape[0] > 1"
+    assert _lambda_to_string(second) == "lambda s: s.sum() < 10"
+
+
+def test_lambda_to_string_in_call_with_other_args():
+    fn = _pass_through(lambda df: df["a"].max() > 0, "Fail message", verbose=True)
+    assert _lambda_to_string(fn) == """lambda df: df["a"].max() > 0"""
+
+
+def test_lambda_to_string_ambiguous_falls_back_to_source_line():
+    """Two lambdas with the same arguments on one line can't be told apart"""
+    first, second = lambda df: df.shape[0] > 1, lambda df: df.shape[1] > 1
+    line = "first, second = lambda df: df.shape[0] > 1, lambda df: df.shape[1] > 1\n"
+    assert _lambda_to_string(first) == line
+    assert _lambda_to_string(second) == line
+
+
+def test_lambda_to_string_unparseable_source_falls_back_to_source_line():
+    """If the file's lambdas can't be found by parsing it, show the lines that contain the function"""
+    filename = "<test_lambda_to_string_unparseable>"
+    lines = ["fn = lambda df: df.shape[0] > 1\n", "not valid python (\n"]
+    linecache.cache[filename] = (sum(map(len, lines)), None, lines, filename)
+    namespace = {}
+    exec(compile(lines[0], filename, "exec"), namespace)
+    try:
+        assert _lambda_to_string(namespace["fn"]) == lines[0]
+    finally:
+        del linecache.cache[filename]
+
+
+def test_lambda_to_string_after_source_changes():
+    """A lambda from an edited and reloaded file should show its new source, not the cached one"""
+    filename = "<test_lambda_to_string_after_source_changes>"
+    try:
+        for source in (
+            "fn = lambda df: df.shape[0] > 1\n",
+            "fn = lambda df: df.shape[1] > 99\n",
+        ):
+            linecache.cache[filename] = (len(source), None, [source], filename)
+            namespace = {}
+            exec(compile(source, filename, "exec"), namespace)
+            assert _lambda_to_string(namespace["fn"]) == source[5:-1]
+    finally:
+        del linecache.cache[filename]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    (
+        {},
+        {"ascending": True},
+        {"normalize": True},
+        {"dropna": False},
+    ),
+)
+@pytest.mark.parametrize("n", (1, 5, 50, 5000))
+def test_top_value_counts_ties_in_order_of_appearance(kwargs, n):
+    """The top values should be sorted by count, then by first appearance"""
+    values = np.random.default_rng(0).integers(0, 1000, 10000).astype(float)
+    values[::97] = np.nan
+    s = pd.Series(values)
+    counts = s.value_counts(**{**kwargs, "sort": False})
+    expected = counts.iloc[
+        np.argsort(
+            counts.to_numpy() * (1 if kwargs.get("ascending") else -1), kind="stable"
+        )
+    ].head(n)
+    result = _top_value_counts(s, n, **kwargs)
+    if n < len(counts):
+        pd.testing.assert_series_equal(result, expected)
+    else:
+        pd.testing.assert_series_equal(result, s.value_counts(**kwargs))